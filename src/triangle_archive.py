@@ -0,0 +1,207 @@
+'''
+Archive format for storing many triangles of numbers in a single file, with
+an index that allows any triangle to be read without parsing the others.
+
+An archive starts with a header, followed by the numbers of each triangle as
+little-endian 64-bit integers, row by row. The index follows the triangles
+and holds the byte offset and row count of each triangle, ordered by triangle
+ID. A trailer at the very end of the file locates the index.
+
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+import mmap
+import struct
+
+import triangle_search
+
+# Identifies triangle archives.
+ARCHIVE_MAGIC = "TARC"
+
+# Version of the archive format.
+ARCHIVE_VERSION = 1
+
+# Header at the start of an archive: magic and format version.
+ARCHIVE_HEADER = struct.Struct("<4sI")
+
+# Index entry of a triangle: byte offset and row count.
+INDEX_ENTRY = struct.Struct("<QI")
+
+# Trailer at the end of an archive: byte offset of the index, number of
+# triangles and magic.
+ARCHIVE_TRAILER = struct.Struct("<QQ4s")
+
+
+def read_text_triangles(lines):
+    """Splits concatenated text triangles into separate triangles. A new
+    triangle starts at every row that contains a single number.
+
+    Args:
+        lines: An iterable of strings, such as an open file, where each
+            non-empty string contains a row of whitespace separated integers.
+
+    Returns:
+        A generator of lists of lists of integers.
+    """
+    nums = []
+    for row in triangle_search.parse_triangle(lines):
+        if len(row) == 1 and nums:
+            yield nums
+            nums = []
+        nums.append(row)
+
+    if nums:
+        yield nums
+
+
+def write_archive(archive_path, triangles):
+    """Writes triangles to an archive. Triangle IDs are assigned in order,
+    starting at 0.
+
+    Args:
+        archive_path: Path of the archive to write.
+        triangles: An iterable of lists of lists of integers.
+
+    Returns:
+        The number of triangles written.
+    """
+    index = []
+
+    with open(archive_path, 'wb') as archive_fh:
+        archive_fh.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION))
+
+        for nums in triangles:
+            if len(nums) == 0:
+                raise Exception("Triangle %d must be non-empty" % len(index))
+
+            index.append((archive_fh.tell(), len(nums)))
+
+            for row, row_nums in enumerate(nums):
+                if len(row_nums) != row + 1:
+                    raise Exception("Row %d of triangle %d must contain %d "
+                                    "numbers" % (row, len(index) - 1, row + 1))
+                archive_fh.write(struct.pack("<%dq" % len(row_nums),
+                                             *row_nums))
+
+        index_offset = archive_fh.tell()
+        for offset, row_count in index:
+            archive_fh.write(INDEX_ENTRY.pack(offset, row_count))
+
+        archive_fh.write(ARCHIVE_TRAILER.pack(index_offset, len(index),
+                                              ARCHIVE_MAGIC))
+
+    return len(index)
+
+
+class TriangleArchive(object):
+    """Memory mapped triangle archive that reads triangles by ID.
+    """
+
+    def __init__(self, archive_path):
+        """Opens an archive.
+
+        Args:
+            archive_path: Path of an archive written by write_archive.
+        """
+        with open(archive_path, 'rb') as archive_fh:
+            self._mm = mmap.mmap(archive_fh.fileno(), 0,
+                                 access=mmap.ACCESS_READ)
+
+        magic, version = ARCHIVE_HEADER.unpack_from(self._mm, 0)
+        index_offset, triangle_count, trailer_magic = (
+            ARCHIVE_TRAILER.unpack_from(
+                self._mm, len(self._mm) - ARCHIVE_TRAILER.size))
+
+        if (magic != ARCHIVE_MAGIC or trailer_magic != ARCHIVE_MAGIC or
+                version != ARCHIVE_VERSION):
+            self._mm.close()
+            raise Exception("%s is not a compatible triangle archive"
+                            % archive_path)
+
+        self._index_offset = index_offset
+        self._triangle_count = triangle_count
+
+    def __len__(self):
+        return self._triangle_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Unmaps the archive.
+        """
+        self._mm.close()
+
+    def read_triangle(self, triangle_id):
+        """Reads a triangle.
+
+        Args:
+            triangle_id: ID of the triangle.
+
+        Returns:
+            A list of lists of integers.
+        """
+        if not 0 <= triangle_id < self._triangle_count:
+            raise IndexError("No triangle with ID %d" % triangle_id)
+
+        offset, row_count = INDEX_ENTRY.unpack_from(
+            self._mm, self._index_offset + triangle_id * INDEX_ENTRY.size)
+        value_count = row_count * (row_count + 1) // 2
+        values = struct.unpack_from("<%dq" % value_count, self._mm, offset)
+
+        return [list(values[row * (row + 1) // 2:(row + 1) * (row + 2) // 2])
+                for row in xrange(row_count)]
+
+    def solve(self, triangle_ids):
+        """Finds the maximum sums of a subset of the triangles.
+
+        Args:
+            triangle_ids: An iterable of triangle IDs.
+
+        Returns:
+            A generator of pairs containing a triangle ID and the maximum
+            sum from the top to the bottom of the triangle.
+        """
+        for triangle_id in triangle_ids:
+            yield (triangle_id, triangle_search.find_max_sum_rows(
+                self.read_triangle(triangle_id)))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Build triangle archives and solve archived triangles.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    build_parser = subparsers.add_parser(
+        "build", help="Build an archive from text triangles.")
+    build_parser.add_argument("archive", help="Path of the archive to write.")
+    build_parser.add_argument("triangles", nargs="+",
+                              help="Files containing concatenated triangles.")
+
+    solve_parser = subparsers.add_parser(
+        "solve", help="Print the maximum sums of archived triangles.")
+    solve_parser.add_argument("archive", help="Path of the archive.")
+    solve_parser.add_argument("ids", nargs="*", type=int,
+                              help="Triangle IDs, defaults to all triangles.")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        def all_triangles():
+            for triangles_path in args.triangles:
+                with open(triangles_path, 'r') as triangles_fh:
+                    for nums in read_text_triangles(triangles_fh):
+                        yield nums
+
+        print write_archive(args.archive, all_triangles())
+    else:
+        with TriangleArchive(args.archive) as archive:
+            for triangle_id, max_sum in archive.solve(
+                    args.ids or xrange(len(archive))):
+                print triangle_id, max_sum
@@ -0,0 +1,169 @@
+'''
+On-disk cache of triangle search results, so that identical triangles that
+are submitted repeatedly are only solved once.
+
+Results are addressed by a hash of the normalized triangle and the search
+engine version, and each result is stored in its own file. The least recently
+used results are evicted once the cache grows beyond its size limit.
+
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+import hashlib
+import json
+import os
+
+import triangle_search
+
+# Cache directory used by the triangle_search command line.
+DEFAULT_CACHE_DIR = "~/.cache/triangle_search"
+
+# Default limit for the total size of all cached results, in bytes.
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# File name extension of cached results.
+ENTRY_EXTENSION = ".json"
+
+
+def triangle_key(nums, engine_version=triangle_search.ENGINE_VERSION):
+    """Computes the cache key of a triangle. Triangles that only differ in
+    whitespace have the same key.
+
+    Args:
+        nums: A list of lists of integers.
+        engine_version: Version of the engine that solves the triangle.
+
+    Returns:
+        The key as a string of hexadecimal digits.
+    """
+    key_hash = hashlib.sha1()
+    key_hash.update("engine %s\n" % engine_version)
+
+    for row in nums:
+        key_hash.update(" ".join(str(x) for x in row))
+        key_hash.update("\n")
+
+    return key_hash.hexdigest()
+
+
+class TriangleCache(object):
+    """A directory of cached triangle search results with least recently
+    used eviction.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        """Constructs a new TriangleCache, creating the cache directory if
+        needed.
+
+        Args:
+            cache_dir: Path to the cache directory.
+            max_bytes: Limit for the total size of all cached results.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+    def _entry_path(self, key):
+        """Returns the path of the file that holds a cached result.
+
+        Args:
+            key: A key returned by triangle_key.
+        """
+        return os.path.join(self.cache_dir, key + ENTRY_EXTENSION)
+
+    def _entry_paths(self):
+        """Returns the paths of all cached result files.
+        """
+        return [os.path.join(self.cache_dir, name) for name
+                in os.listdir(self.cache_dir) if name.endswith(ENTRY_EXTENSION)]
+
+    def get(self, key, with_path=False):
+        """Looks up a cached result.
+
+        Args:
+            key: A key returned by triangle_key.
+            with_path: Whether the result must include the best path.
+
+        Returns:
+            A dictionary containing the maximum sum under "max_sum" and, if
+            it was stored, the best path under "path". None if no suitable
+            result is cached.
+        """
+        entry_path = self._entry_path(key)
+
+        try:
+            with open(entry_path, 'r') as entry_fh:
+                result = json.load(entry_fh)
+        except (IOError, ValueError):
+            return None
+
+        if with_path and result.get("path") is None:
+            return None
+
+        # The modification time records when an entry was last used. Another
+        # process may have evicted the entry since it was read.
+        try:
+            os.utime(entry_path, None)
+        except OSError:
+            pass
+
+        return result
+
+    def put(self, key, max_sum, path=None):
+        """Stores a result, evicting the least recently used results if the
+        cache grows too large.
+
+        Args:
+            key: A key returned by triangle_key.
+            max_sum: The maximum sum of the triangle.
+            path: The best path as returned by triangle_search.find_max_path,
+                or None.
+        """
+        entry_path = self._entry_path(key)
+        temp_path = "%s.%d.tmp" % (entry_path, os.getpid())
+
+        # Write to a temporary file first so that concurrent readers never
+        # see a partially written entry.
+        with open(temp_path, 'w') as entry_fh:
+            json.dump({"max_sum": max_sum, "path": path}, entry_fh)
+        os.rename(temp_path, entry_path)
+
+        self._evict()
+
+    def _evict(self):
+        """Removes the least recently used results until the cache fits
+        within its size limit.
+        """
+        entries = []
+        for entry_path in self._entry_paths():
+            try:
+                stat = os.stat(entry_path)
+            except OSError:
+                # Removed by another process.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+
+        for _, size, entry_path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+            total_bytes -= size
+
+    def clear(self):
+        """Removes all cached results.
+        """
+        for entry_path in self._entry_paths():
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
@@ -0,0 +1,184 @@
+'''
+Parallel engine for finding the maximum sum from the top to the bottom of a
+single, very large triangle of numbers.
+
+The triangle is copied into a shared memory buffer once and the best sums are
+computed bottom-up, a block of rows at a time. The top row of each block is
+split into column chunks that worker processes compute independently: since a
+best sum only depends on the two best sums directly below it, a chunk that is
+block_rows rows tall only needs block_rows extra columns of the row below the
+block, and the few overlapping sums are simply computed twice. Workers
+synchronize once per block, when all chunks of the block are done. Small
+triangles and narrow rows are computed serially, where the cost of
+coordinating the workers would dominate.
+
+The shared buffers hold C longs, so triangles whose sums could overflow a C
+long are solved by the serial engine instead.
+
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+import multiprocessing
+import sys
+
+from itertools import izip
+from multiprocessing.sharedctypes import RawArray
+
+import triangle_search
+
+# Smallest triangle and number of CPUs for which the parallel engine pays
+# off, smaller triangles are solved by the serial engine. With a single
+# worker, the parallel engine takes about 1.8 times as long as the serial
+# engine on a 3000 row triangle (copying the triangle into shared memory and
+# slicing it back out dominate).
+MIN_PARALLEL_ROWS = 10000
+MIN_PARALLEL_CPUS = 4
+
+# Number of columns computed by a single worker task. Blocks whose top row
+# is narrower than two chunks are computed serially.
+CHUNK_WIDTH = 2000
+
+# Number of rows computed by a worker task between synchronizations.
+BLOCK_ROWS = 64
+
+# Shared memory buffers inherited by the worker processes.
+_shared = {}
+
+
+def _init_worker(values, buffers):
+    """Stores the shared memory buffers in a worker process.
+
+    Args:
+        values: A RawArray containing all triangle numbers, row by row.
+        buffers: A pair of RawArrays that alternately hold the best sums of
+            the row below and of the row being computed.
+    """
+    _shared['values'] = values
+    _shared['buffers'] = buffers
+
+
+def _compute_chunk(values, below_sums, top_sums, below_row, top_row, lo, hi):
+    """Computes the best sums of a range of columns of the top row of a
+    block of rows.
+
+    Args:
+        values: A RawArray containing all triangle numbers, row by row.
+        below_sums: A RawArray with the best sums of the row below the
+            block.
+        top_sums: A RawArray that receives the best sums of the top row of
+            the block.
+        below_row: Index of the row below the block.
+        top_row: Index of the top row of the block.
+        lo: First column of the chunk.
+        hi: One past the last column of the chunk.
+    """
+    # Each row up needs one column less of the row below it.
+    sums = below_sums[lo:min(hi + below_row - top_row, below_row + 1)]
+
+    for row in xrange(below_row - 1, top_row - 1, -1):
+        row_offset = row * (row + 1) // 2
+        end = min(hi + row - top_row, row + 1)
+        sums = [value + max(left, right) for value, left, right
+                in izip(values[row_offset + lo:row_offset + end],
+                        sums, sums[1:])]
+
+    top_sums[lo:hi] = sums
+
+
+def _compute_chunk_task(task):
+    """Worker entry point that computes a chunk of the top row of a block.
+
+    Args:
+        task: A tuple containing the index of the row below the block, the
+            index of the top row of the block, the first and one past the
+            last column of the chunk, and the index of the buffer holding the
+            best sums of the row below the block.
+    """
+    below_row, top_row, lo, hi, below_index = task
+    buffers = _shared['buffers']
+
+    _compute_chunk(_shared['values'], buffers[below_index],
+                   buffers[1 - below_index], below_row, top_row, lo, hi)
+
+
+def _fits_c_long(nums):
+    """Checks that no best sum of a triangle can overflow a C long.
+
+    Args:
+        nums: A list of lists of integers.
+
+    Returns:
+        True if every path sum is guaranteed to fit in a C long.
+    """
+    return triangle_search.max_abs_value(nums) * len(nums) <= sys.maxint
+
+
+def find_max_sum_parallel(nums, processes=None,
+                          min_parallel_rows=MIN_PARALLEL_ROWS,
+                          chunk_width=CHUNK_WIDTH,
+                          block_rows=BLOCK_ROWS):
+    """Returns the maximum sum from the top to the bottom of a triangle of
+    numbers, using several processes.
+
+    Args:
+        nums: A list of lists of integers, as accepted by
+            triangle_search.create_num_tree. Triangles whose sums could
+            overflow a C long are solved serially.
+        processes: Number of worker processes, defaults to the number of
+            CPUs.
+        min_parallel_rows: Triangles with fewer rows are solved serially.
+        chunk_width: Number of columns computed by a single worker task.
+        block_rows: Number of rows computed by a worker task between
+            synchronizations.
+
+    Returns:
+        The maximum sum from the top to the bottom of the triangle.
+    """
+    if len(nums) < max(min_parallel_rows, 1):
+        return triangle_search.find_max_sum_rows(nums)
+
+    row_count = len(nums)
+
+    for row, row_nums in enumerate(nums):
+        if len(row_nums) != row + 1:
+            raise Exception("Row %d must contain %d numbers" % (row, row + 1))
+
+    if not _fits_c_long(nums):
+        return triangle_search.find_max_sum_rows(nums)
+
+    values = RawArray('l', row_count * (row_count + 1) // 2)
+    row_offset = 0
+    for row_nums in nums:
+        values[row_offset:row_offset + len(row_nums)] = row_nums
+        row_offset += len(row_nums)
+
+    buffers = (RawArray('l', row_count), RawArray('l', row_count))
+    buffers[0][:] = nums[-1]
+    below_index = 0
+
+    pool = multiprocessing.Pool(processes, _init_worker, (values, buffers))
+    try:
+        below_row = row_count - 1
+        while below_row > 0:
+            top_row = max(below_row - block_rows, 0)
+            width = top_row + 1
+
+            if width < 2 * chunk_width:
+                _compute_chunk(values, buffers[below_index],
+                               buffers[1 - below_index], below_row, top_row,
+                               0, width)
+            else:
+                pool.map(_compute_chunk_task,
+                         [(below_row, top_row, lo,
+                           min(lo + chunk_width, width), below_index)
+                          for lo in xrange(0, width, chunk_width)])
+
+            below_index = 1 - below_index
+            below_row = top_row
+    finally:
+        pool.terminate()
+        pool.join()
+
+    return buffers[below_index][0]
@@ -7,6 +7,34 @@ the maximum sum from top to bottom.
 @author: Mitchell Lee
 '''
 
+import logging
+import multiprocessing
+import sys
+
+from itertools import izip
+
+# Version of the search engines, changes whenever their results could differ
+# from previously computed (and cached) results.
+ENGINE_VERSION = "1"
+
+# Engines that find_max_sum and find_max_path can use. "tree" searches a
+# NumTree, "rows" keeps one row of best sums (and one byte per number to
+# rebuild the path), "table" keeps a BestSumTable,
+# "parallel" splits rows between processes and "stream" reads the triangle
+# from a file without keeping it in memory.
+ENGINE_AUTO = "auto"
+ENGINES = ("tree", "rows", "table", "parallel", "stream")
+
+# Largest triangle searched with a NumTree, the search recurses once per row.
+TREE_MAX_ROWS = 200
+
+# Approximate memory use per number of the triangle, in bytes.
+NUMS_BYTES_PER_NUMBER = 32
+TREE_BYTES_PER_NUMBER = 400
+ARRAY_BYTES_PER_NUMBER = 8
+
+logger = logging.getLogger(__name__)
+
 
 class NumTree(object):
     """Contains a tree of numbers.
@@ -92,15 +120,23 @@ def create_num_tree(nums):
     return NumTree(populate_tree(nums, 0, 0))
 
 
-def find_max_sum(tree):
+def find_max_sum(tree, engine=ENGINE_AUTO, memory_budget=None):
     """Returns the maximum sum from the top to the bottom of the tree.
 
     Args:
-        tree: A NumTree.
+        tree: A NumTree, or a list of lists of numbers as accepted by
+            create_num_tree.
+        engine: For a list of lists, the name of the engine to use, or
+            ENGINE_AUTO to let choose_engine pick one.
+        memory_budget: For a list of lists, the number of bytes that
+            ENGINE_AUTO may use, or None for no limit.
 
     Returns:
         The maximum sum from the top to the bottom of the tree.
     """
+    if not isinstance(tree, NumTree):
+        return _solve(tree, False, engine, memory_budget)
+
     def find_max(node):
         """Finds the maximum sum from the current node to its children.
 
@@ -126,17 +162,481 @@ def find_max_sum(tree):
     return find_max(tree.root)
 
 
-if __name__ == "__main__":
-    import sys
+def find_max_path(tree, engine=ENGINE_AUTO, memory_budget=None):
+    """Returns the path with the maximum sum from the top to the bottom of
+    the tree.
+
+    Args:
+        tree: A NumTree, or a list of lists of numbers as accepted by
+            create_num_tree.
+        engine: For a list of lists, the name of the engine to use, or
+            ENGINE_AUTO to let choose_engine pick one.
+        memory_budget: For a list of lists, the number of bytes that
+            ENGINE_AUTO may use, or None for no limit.
+
+    Returns:
+        A list containing, for each level of the tree, the index of the
+        number on the path within its level.
+    """
+    if not isinstance(tree, NumTree):
+        return _solve(tree, True, engine, memory_budget)
+
+    find_max_sum(tree)
+
+    path = [0]
+    node = tree.root
+
+    while node.left is not None:
+        if node.left.cached_sum >= node.right.cached_sum:
+            node = node.left
+            path.append(path[-1])
+        else:
+            node = node.right
+            path.append(path[-1] + 1)
+
+    return path
+
+
+def find_max_sum_rows(nums):
+    """Returns the maximum sum from the top to the bottom of a triangle of
+    numbers, without building a NumTree. Only the best sums of the row below
+    the current row are kept, so memory use is proportional to the width of
+    the triangle.
+
+    Args:
+        nums: A list of lists of numbers, as accepted by create_num_tree.
+
+    Returns:
+        The maximum sum from the top to the bottom of the triangle.
+    """
+    if len(nums) == 0:
+        raise Exception("List of lists must be non-empty")
+
+    # Best sums from each number in the row below to the bottom.
+    below_sums = list(nums[-1])
+
+    for row in reversed(nums[:-1]):
+        below_sums = [value + max(left, right) for value, left, right
+                      in izip(row, below_sums, below_sums[1:])]
+
+    return below_sums[0]
+
+
+def find_max_path_rows(nums):
+    """Returns the path with the maximum sum from the top to the bottom of a
+    triangle of numbers, without building a NumTree. Like find_max_sum_rows,
+    only the best sums of one row are kept, along with one byte per number
+    recording which number below it continues its best path.
+
+    Args:
+        nums: A list of lists of numbers, as accepted by create_num_tree.
+
+    Returns:
+        A list containing, for each row, the index of the number on the path
+        within its row.
+    """
+    if len(nums) == 0:
+        raise Exception("List of lists must be non-empty")
+
+    # Best sums from each number in the row below to the bottom.
+    below_sums = list(nums[-1])
+
+    # For each row above the bottom row, which numbers continue their best
+    # path to the right rather than to the left.
+    goes_right = []
+
+    for row in reversed(nums[:-1]):
+        row_goes_right = bytearray(len(row))
+        sums = []
+
+        for col, (value, left, right) in enumerate(
+                izip(row, below_sums, below_sums[1:])):
+            if left >= right:
+                sums.append(value + left)
+            else:
+                sums.append(value + right)
+                row_goes_right[col] = 1
+
+        goes_right.append(row_goes_right)
+        below_sums = sums
+
+    path = [0]
+    for row_goes_right in reversed(goes_right):
+        path.append(path[-1] + row_goes_right[path[-1]])
+
+    return path
+
+
+class EngineChoice(object):
+    """An engine picked to search a triangle, and why it was picked.
+    """
+
+    def __init__(self, engine, reason, estimated_bytes):
+        """Constructs a new EngineChoice.
+
+        Args:
+            engine: Name of the engine, one of ENGINES.
+            reason: A human readable explanation of the choice.
+            estimated_bytes: Approximate memory use of the engine.
+        """
+        self.engine = engine
+        self.reason = reason
+        self.estimated_bytes = estimated_bytes
+
+    def __str__(self):
+        return "%s engine (~%d bytes): %s" % (self.engine,
+                                               self.estimated_bytes,
+                                               self.reason)
+
+
+def estimate_memory(engine, row_count, want_path=False):
+    """Estimates the memory an engine uses to search a triangle, including
+    the triangle itself for the engines that keep it in memory.
+
+    Args:
+        engine: Name of the engine, one of ENGINES.
+        row_count: Number of rows of the triangle.
+        want_path: Whether the best path is searched for as well.
+
+    Returns:
+        The approximate number of bytes.
+    """
+    numbers = row_count * (row_count + 1) // 2
+    row_bytes = row_count * NUMS_BYTES_PER_NUMBER
+
+    if engine == "tree":
+        return numbers * (NUMS_BYTES_PER_NUMBER + TREE_BYTES_PER_NUMBER)
+    elif engine in ("table", "parallel"):
+        return numbers * (NUMS_BYTES_PER_NUMBER + ARRAY_BYTES_PER_NUMBER)
+    elif engine == "rows" and want_path:
+        return numbers * (NUMS_BYTES_PER_NUMBER + 1) + 2 * row_bytes
+    elif engine == "stream":
+        # Up to about twice the square root of the row count checkpoints and
+        # recomputed rows when searching for the path.
+        if want_path:
+            return (2 * int(row_count ** 0.5) + 2) * row_bytes
+        else:
+            return 2 * row_bytes
+    else:
+        return numbers * NUMS_BYTES_PER_NUMBER + 2 * row_bytes
 
-    # Parse input
-    nums = []
-    with open(sys.argv[1], 'r') as test_cases:
-        for test in test_cases:
-            nums.append([int(x) for x in test.split()])
 
-    # Create the tree of numbers
-    tree = create_num_tree(nums)
+def choose_engine(row_count, want_path=False, memory_budget=None,
+                  can_stream=False, max_abs_value=None):
+    """Picks the engine that is expected to search a triangle the fastest
+    within a memory budget.
+
+    Args:
+        row_count: Number of rows of the triangle.
+        want_path: Whether the best path is searched for as well.
+        memory_budget: Number of bytes the engine may use, or None for no
+            limit.
+        can_stream: Whether the triangle is in a file that the "stream"
+            engine can read.
+        max_abs_value: Largest absolute value of the numbers of the
+            triangle, or None if unknown. The "parallel" engine is only
+            picked when all path sums are known to fit in a C long.
+
+    Returns:
+        An EngineChoice.
+    """
+    import triangle_parallel
+
+    fits_c_long = (max_abs_value is not None and
+                   max_abs_value * row_count <= sys.maxint)
+
+    if row_count <= TREE_MAX_ROWS:
+        preferred = ["tree"]
+        reason = "small triangle (%d rows)" % row_count
+    elif want_path:
+        preferred = ["rows"]
+        reason = "path of a triangle with %d rows" % row_count
+    elif (row_count >= triangle_parallel.MIN_PARALLEL_ROWS and
+          (multiprocessing.cpu_count() >=
+           triangle_parallel.MIN_PARALLEL_CPUS) and fits_c_long):
+        preferred = ["parallel"]
+        reason = "large triangle (%d rows) and %d CPUs" % (
+            row_count, multiprocessing.cpu_count())
+    else:
+        preferred = ["rows"]
+        reason = "medium triangle (%d rows)" % row_count
+
+    # Engines to fall back to when the preferred engine needs too much
+    # memory, from the fastest to the most frugal.
+    fallbacks = ["rows"]
+    if can_stream:
+        fallbacks.append("stream")
+
+    for engine in preferred + [x for x in fallbacks if x not in preferred]:
+        estimated_bytes = estimate_memory(engine, row_count, want_path)
+
+        if memory_budget is None or estimated_bytes <= memory_budget:
+            if engine not in preferred:
+                reason = ("%s needs more than the %d byte memory budget"
+                          % (preferred[0], memory_budget))
+            return EngineChoice(engine, reason, estimated_bytes)
+
+    engine = fallbacks[-1]
+    return EngineChoice(engine,
+                        "no engine fits the %d byte memory budget, using "
+                        "the most frugal one" % memory_budget,
+                        estimate_memory(engine, row_count, want_path))
+
+
+def _solve(nums, want_path, engine, memory_budget):
+    """Searches a triangle of numbers held in memory with a given engine.
+
+    Args:
+        nums: A list of lists of numbers.
+        want_path: Whether to return the best path instead of the maximum
+            sum.
+        engine: Name of the engine, or ENGINE_AUTO.
+        memory_budget: Number of bytes ENGINE_AUTO may use, or None.
+
+    Returns:
+        The maximum sum, or the best path if want_path is set.
+    """
+    if engine == ENGINE_AUTO:
+        choice = choose_engine(len(nums), want_path, memory_budget,
+                               max_abs_value=max_abs_value(nums))
+        logger.info("Using %s", choice)
+        engine = choice.engine
+
+    if engine == "tree":
+        tree = create_num_tree(nums)
+        return find_max_path(tree) if want_path else find_max_sum(tree)
+    elif engine == "table":
+        import triangle_table
+
+        table = triangle_table.BestSumTable.from_triangle(nums)
+        return table.max_path() if want_path else table.max_sum()
+    elif engine == "rows":
+        if want_path:
+            return find_max_path_rows(nums)
+        else:
+            return find_max_sum_rows(nums)
+    elif engine == "parallel" and not want_path:
+        import triangle_parallel
+
+        return triangle_parallel.find_max_sum_parallel(nums)
+    else:
+        raise Exception("The %s engine cannot search for the %s of a "
+                        "triangle in memory"
+                        % (engine, "path" if want_path else "maximum sum"))
+
+
+def max_abs_value(nums):
+    """Returns the largest absolute value of the numbers of a triangle.
+
+    Args:
+        nums: A list of lists of numbers.
+
+    Returns:
+        The largest absolute value, or 0 for an empty triangle.
+    """
+    return max([0] + [max(abs(min(row_nums)), abs(max(row_nums)))
+                      for row_nums in nums if row_nums])
+
+
+def count_rows(lines):
+    """Counts the rows of a triangle without parsing its numbers.
+
+    Args:
+        lines: An iterable of strings, such as an open file.
+
+    Returns:
+        The number of non-empty lines.
+    """
+    return sum(1 for line in lines if line.strip())
+
+
+def solve_triangle_file(triangle_path, want_path=False, engine=ENGINE_AUTO,
+                        memory_budget=None):
+    """Searches a triangle stored in a file.
+
+    Args:
+        triangle_path: Path to a file where each non-empty line contains a
+            row of whitespace separated integers.
+        want_path: Whether to search for the best path as well.
+        engine: Name of the engine to use, or ENGINE_AUTO to let
+            choose_engine pick one.
+        memory_budget: Number of bytes ENGINE_AUTO may use, or None.
+
+    Returns:
+        A pair containing a dictionary with the maximum sum under "max_sum"
+        and, if requested, the best path under "path", and the
+        EngineChoice.
+    """
+    with open(triangle_path, 'r') as triangle_fh:
+        row_count = count_rows(triangle_fh)
+
+    if engine == ENGINE_AUTO:
+        # The numbers are not parsed yet, so the "parallel" engine can only
+        # be picked once they are.
+        choice = choose_engine(row_count, want_path, memory_budget,
+                               can_stream=True)
+    else:
+        choice = EngineChoice(engine, "requested",
+                              estimate_memory(engine, row_count, want_path))
+
+    if choice.engine == "stream":
+        logger.info("Using %s", choice)
+
+        import triangle_stream
+
+        if want_path:
+            max_sum, path = triangle_stream.find_max_path_streaming(
+                triangle_path)
+            return {"max_sum": max_sum, "path": path}, choice
+        else:
+            return ({"max_sum": triangle_stream.find_max_sum_streaming(
+                triangle_path)}, choice)
+
+    with open(triangle_path, 'r') as triangle_fh:
+        nums = parse_triangle(triangle_fh)
+
+    if engine == ENGINE_AUTO and choice.engine == "rows":
+        choice = choose_engine(row_count, want_path, memory_budget,
+                               can_stream=True,
+                               max_abs_value=max_abs_value(nums))
+
+    logger.info("Using %s", choice)
+
+    if want_path:
+        path = _solve(nums, True, choice.engine, None)
+        max_sum = sum(nums[row][col] for row, col in enumerate(path))
+        return {"max_sum": max_sum, "path": path}, choice
+    else:
+        return {"max_sum": _solve(nums, False, choice.engine, None)}, choice
+
+
+def parse_memory_size(text):
+    """Parses a memory size such as "512M".
+
+    Args:
+        text: A number of bytes, optionally followed by K, M or G.
+
+    Returns:
+        The number of bytes.
+    """
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    text = text.strip().upper()
+
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    else:
+        return int(text)
+
+
+def iter_triangle(lines):
+    """Parses a triangle of numbers one row at a time.
+
+    Args:
+        lines: An iterable of strings, such as an open file, where each
+            string contains whitespace separated integers.
+
+    Returns:
+        A generator of lists of integers, one list per non-empty line.
+    """
+    for line in lines:
+        row = [int(x) for x in line.split()]
+        if row:
+            yield row
+
+
+def parse_triangle(lines):
+    """Parses a triangle of numbers.
+
+    Args:
+        lines: An iterable of strings, such as an open file, where each
+            string contains whitespace separated integers.
+
+    Returns:
+        A list of lists of integers, one list per non-empty line.
+    """
+    return list(iter_triangle(lines))
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import sys
 
-    # Find the maximum sum
-    print find_max_sum(tree)
\ No newline at end of file
+    import triangle_cache
+
+    parser = argparse.ArgumentParser(
+        description="Find the maximum sum from the top to the bottom of a "
+        "triangle of numbers.")
+    parser.add_argument("triangle", nargs="?",
+                        help="Path to a file containing the triangle.")
+    parser.add_argument("--path", action="store_true",
+                        help="Also print the numbers on the best path.")
+    parser.add_argument("--engine", choices=(ENGINE_AUTO,) + ENGINES,
+                        default=ENGINE_AUTO,
+                        help="Search engine, by default picked from the "
+                        "triangle size and memory budget.")
+    parser.add_argument("--memory-budget", type=parse_memory_size,
+                        help="Memory the automatically picked engine may use, "
+                        "such as 512M.")
+    parser.add_argument("--explain", action="store_true",
+                        help="Log the picked engine and why to stderr.")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse results for identical triangles from the "
+                        "cache directory.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Disable the result cache, overrides --cache and "
+                        "--cache-dir.")
+    parser.add_argument("--cache-dir",
+                        help="Result cache directory, implies --cache "
+                        "(default: %s)." % triangle_cache.DEFAULT_CACHE_DIR)
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Remove all cached results.")
+    args = parser.parse_args()
+
+    if args.path and args.engine == "parallel":
+        parser.error("the parallel engine cannot search for the path, use "
+                     "the rows, table or stream engine")
+
+    if args.explain:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    cache_dir = os.path.expanduser(args.cache_dir or
+                                   triangle_cache.DEFAULT_CACHE_DIR)
+
+    if args.clear_cache:
+        triangle_cache.TriangleCache(cache_dir).clear()
+
+    cache = None
+    if (args.cache or args.cache_dir) and not args.no_cache:
+        cache = triangle_cache.TriangleCache(cache_dir)
+
+    if args.triangle is None:
+        if not args.clear_cache:
+            parser.error("a triangle file is required")
+        sys.exit(0)
+
+    key = None
+    result = None
+    if cache is not None:
+        # The triangle is hashed row by row, so that the streaming engine
+        # never needs the whole triangle in memory.
+        with open(args.triangle, 'r') as test_cases:
+            key = triangle_cache.triangle_key(iter_triangle(test_cases))
+        result = cache.get(key, with_path=args.path)
+
+        if result is not None:
+            logger.info("Using cached result %s", key)
+
+    if result is None:
+        # Find the maximum sum
+        result, _ = solve_triangle_file(args.triangle, args.path,
+                                        args.engine, args.memory_budget)
+
+        if cache is not None:
+            cache.put(key, result["max_sum"], result.get("path"))
+
+    print result["max_sum"]
+    if args.path:
+        with open(args.triangle, 'r') as test_cases:
+            print " ".join(str(row[col]) for row, col
+                           in izip(iter_triangle(test_cases), result["path"]))
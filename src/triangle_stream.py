@@ -0,0 +1,173 @@
+'''
+Low memory search for the path with the maximum sum from the top to the
+bottom of a triangle of numbers stored in a file, for triangles that are too
+large to keep in memory.
+
+The triangle is read once from top to bottom while computing the best sum of
+a path to each number. Only the best sums of every k-th row are kept as
+checkpoints, where k grows with the square root of the number of rows read so
+far. The path is then rebuilt from the bottom up, one segment between two
+checkpoints at a time, by re-reading the rows of the segment from the file
+and recomputing their best sums from the checkpoint above. This bounds memory
+to about the square root of the number of rows times the triangle width, for
+roughly the cost of reading the triangle twice.
+
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+from itertools import izip
+
+
+def _next_row(fh):
+    """Reads the next row of a triangle from a file.
+
+    Args:
+        fh: A file opened for reading.
+
+    Returns:
+        A list of integers, or None at the end of the file.
+    """
+    for line in iter(fh.readline, ""):
+        row = [int(x) for x in line.split()]
+        if row:
+            return row
+
+    return None
+
+
+def _next_sums(above_sums, row):
+    """Computes the best sums of paths from the top to each number of a row.
+
+    Args:
+        above_sums: The best sums of the row above, or None for the top row.
+        row: A list of the numbers of the row.
+
+    Returns:
+        A list of best sums.
+    """
+    if above_sums is None:
+        if len(row) != 1:
+            raise Exception("Row 0 must contain 1 number")
+        return list(row)
+
+    if len(row) != len(above_sums) + 1:
+        raise Exception("Row %d must contain %d numbers"
+                        % (len(above_sums), len(above_sums) + 1))
+
+    # Each number can be reached from the numbers above it and above to its
+    # left, the numbers at the ends of a row only have one of them.
+    return [value + max(left, right) for value, left, right
+            in izip(row, above_sums[:1] + above_sums,
+                    above_sums + above_sums[-1:])]
+
+
+def _parent_col(above_sums, col):
+    """Returns the column of the best number above a number.
+
+    Args:
+        above_sums: The best sums of the row above.
+        col: Column of the number.
+    """
+    if col == 0:
+        return 0
+    elif col == len(above_sums) or above_sums[col - 1] >= above_sums[col]:
+        return col - 1
+    else:
+        return col
+
+
+def find_max_sum_streaming(triangle_path):
+    """Finds the maximum sum from the top to the bottom of a triangle stored
+    in a file, keeping only one row of best sums in memory.
+
+    Args:
+        triangle_path: Path to a file where each non-empty line contains a
+            row of whitespace separated integers.
+
+    Returns:
+        The maximum sum.
+    """
+    sums = None
+
+    with open(triangle_path, 'r') as triangle_fh:
+        for row in iter(lambda: _next_row(triangle_fh), None):
+            sums = _next_sums(sums, row)
+
+    if sums is None:
+        raise Exception("Triangle must be non-empty")
+
+    return max(sums)
+
+
+def find_max_path_streaming(triangle_path):
+    """Finds the path with the maximum sum from the top to the bottom of a
+    triangle stored in a file.
+
+    Args:
+        triangle_path: Path to a file where each non-empty line contains a
+            row of whitespace separated integers.
+
+    Returns:
+        A pair containing the maximum sum, and a list containing the column
+        of the number on the path in each row.
+    """
+    # Checkpoints by row, each holding the file offset after the row and the
+    # best sums of the row. Only rows that are a multiple of interval are
+    # kept.
+    checkpoints = {}
+    interval = 1
+
+    with open(triangle_path, 'r') as triangle_fh:
+        sums = None
+        row_index = -1
+
+        while True:
+            row = _next_row(triangle_fh)
+            if row is None:
+                break
+
+            sums = _next_sums(sums, row)
+            row_index += 1
+
+            if row_index % interval == 0:
+                checkpoints[row_index] = (triangle_fh.tell(), sums)
+
+                if len(checkpoints) > interval + 1:
+                    # Too many checkpoints for the rows read so far, keep
+                    # every other one.
+                    interval *= 2
+                    for checkpoint_row in checkpoints.keys():
+                        if checkpoint_row % interval != 0:
+                            del checkpoints[checkpoint_row]
+
+        if sums is None:
+            raise Exception("Triangle must be non-empty")
+
+        last_row = row_index
+        col = max(xrange(len(sums)), key=sums.__getitem__)
+        max_sum = sums[col]
+        path = [col]
+
+        # Rebuild the path one segment at a time, from the bottom up.
+        for checkpoint_row in sorted(checkpoints, reverse=True):
+            if checkpoint_row >= last_row:
+                continue
+
+            offset, checkpoint_sums = checkpoints[checkpoint_row]
+            triangle_fh.seek(offset)
+
+            segment_sums = [checkpoint_sums]
+            for _ in xrange(last_row - checkpoint_row - 1):
+                segment_sums.append(_next_sums(segment_sums[-1],
+                                               _next_row(triangle_fh)))
+
+            for above_sums in reversed(segment_sums):
+                col = _parent_col(above_sums, col)
+                path.append(col)
+
+            last_row = checkpoint_row
+
+    path.reverse()
+    return max_sum, path
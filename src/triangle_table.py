@@ -0,0 +1,158 @@
+'''
+Precomputed table of the best sums of a triangle of numbers, which answers
+queries for the maximum sum from any number to the bottom in constant time.
+
+The table holds the same values as NumNode.cached_sum after a search, but for
+every number of the triangle and stored row by row in a compact array. It can
+be saved to and loaded from disk, so that the search only has to run once.
+
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+import struct
+import sys
+
+from array import array
+
+import triangle_search
+
+# Identifies files written by BestSumTable.save.
+TABLE_MAGIC = "TSUM"
+
+# Header of a saved table: magic, array item size and row count.
+TABLE_HEADER = struct.Struct("<4sIQ")
+
+
+class BestSumTable(object):
+    """Best sums from each number of a triangle to the bottom.
+    """
+
+    def __init__(self, row_count, sums):
+        """Constructs a new BestSumTable. Use from_triangle or load to create
+        a table.
+
+        Args:
+            row_count: Number of rows of the triangle.
+            sums: An array of best sums, row by row.
+        """
+        self.row_count = row_count
+        self.sums = sums
+
+    @classmethod
+    def from_triangle(cls, nums):
+        """Computes the best sums of a triangle.
+
+        Args:
+            nums: A list of lists of integers, as accepted by
+                triangle_search.create_num_tree. The sums of all paths must
+                fit in a C long.
+
+        Returns:
+            A BestSumTable.
+        """
+        if len(nums) == 0:
+            raise Exception("List of lists must be non-empty")
+
+        if triangle_search.max_abs_value(nums) * len(nums) > sys.maxint:
+            raise Exception("Sums of the triangle may not fit in a C long")
+
+        sums = array('l')
+        for row, row_nums in enumerate(nums):
+            if len(row_nums) != row + 1:
+                raise Exception("Row %d must contain %d numbers"
+                                % (row, row + 1))
+            sums.extend(row_nums)
+
+        # Add the best sum below to each number, from the second to last row
+        # up to the top.
+        for row in xrange(len(nums) - 2, -1, -1):
+            row_offset = row * (row + 1) // 2
+            below_offset = row_offset + row + 1
+
+            for col in xrange(row + 1):
+                left = sums[below_offset + col]
+                right = sums[below_offset + col + 1]
+                sums[row_offset + col] += left if left > right else right
+
+        return cls(len(nums), sums)
+
+    def max_sum_from(self, row, col):
+        """Returns the maximum sum from a number to the bottom of the
+        triangle, including the number itself.
+
+        Args:
+            row: Index of the row of the number.
+            col: Index of the number within its row.
+
+        Returns:
+            The maximum sum.
+        """
+        if not (0 <= row < self.row_count and 0 <= col <= row):
+            raise IndexError("No number at row %d, column %d" % (row, col))
+
+        return self.sums[row * (row + 1) // 2 + col]
+
+    def max_sum(self):
+        """Returns the maximum sum from the top to the bottom of the
+        triangle.
+        """
+        return self.sums[0]
+
+    def max_path(self):
+        """Returns the path with the maximum sum from the top to the bottom
+        of the triangle.
+
+        Returns:
+            A list containing, for each row, the index of the number on the
+            path within its row.
+        """
+        path = [0]
+
+        for row in xrange(1, self.row_count):
+            row_offset = row * (row + 1) // 2
+            col = path[-1]
+
+            if self.sums[row_offset + col] >= self.sums[row_offset + col + 1]:
+                path.append(col)
+            else:
+                path.append(col + 1)
+
+        return path
+
+    def save(self, path):
+        """Saves the table to a file. Tables are stored in the byte order of
+        the machine that saves them.
+
+        Args:
+            path: Path of the file to write.
+        """
+        with open(path, 'wb') as table_fh:
+            table_fh.write(TABLE_HEADER.pack(TABLE_MAGIC,
+                                             self.sums.itemsize,
+                                             self.row_count))
+            self.sums.tofile(table_fh)
+
+    @classmethod
+    def load(cls, path):
+        """Loads a table saved by save.
+
+        Args:
+            path: Path of the file to read.
+
+        Returns:
+            A BestSumTable.
+        """
+        with open(path, 'rb') as table_fh:
+            magic, itemsize, row_count = TABLE_HEADER.unpack(
+                table_fh.read(TABLE_HEADER.size))
+
+            sums = array('l')
+            if magic != TABLE_MAGIC or itemsize != sums.itemsize:
+                raise Exception("%s is not a compatible best sum table"
+                                % path)
+
+            sums.fromfile(table_fh, row_count * (row_count + 1) // 2)
+
+        return cls(row_count, sums)
@@ -0,0 +1,237 @@
+'''
+Registry of city buildings that can be edited while hotspots are being
+matched to buildings, without reparsing the city map.
+
+Buildings are kept by name, and a uniform grid maps each cell to the
+buildings whose bounding box overlaps it. Located hotspots are kept in the
+same kind of grid, so that inserting, updating or deleting a building only
+re-checks the hotspots in the cells the building covers.
+
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+from collections import OrderedDict
+from math import floor
+
+from wifi_search import (BuildingRaster, building_bounding_box,
+                         compact_radar_locations, hotspot_radar_locations,
+                         is_hotspot_in_building, is_outline_closed,
+                         radar_compression_ratio, resolve_hotspot_location)
+
+
+class BuildingRegistry(object):
+    """Mutable collection of CityBuildings with a spatial index, which keeps
+    track of the buildings with confirmed hotspots.
+    """
+
+    def __init__(self, cell_size, raster_cell_size=None):
+        """Constructs a new, empty BuildingRegistry.
+
+        Args:
+            cell_size: Width and height of a spatial index cell, ideally
+                about the size of a typical building.
+            raster_cell_size: Cell size of the building rasters, or None to
+                test hotspots against the building outlines only. Buildings
+                with an open outline are never rasterized.
+        """
+        if cell_size <= 0:
+            raise Exception("Cell size must be positive")
+
+        self.cell_size = float(cell_size)
+        self.raster_cell_size = raster_cell_size
+
+        # Buildings by name, in insertion order.
+        self._buildings = OrderedDict()
+
+        # Names of the buildings overlapping each cell, and the cells that
+        # each building overlaps.
+        self._building_grid = {}
+        self._building_cells = {}
+
+        # Hotspot locations by MAC address, and the MAC addresses of the
+        # hotspots located in each cell.
+        self._hotspots = {}
+        self._hotspot_grid = {}
+
+        # MAC addresses of the hotspots located within each building.
+        self._contained_hotspots = {}
+
+    def __len__(self):
+        return len(self._buildings)
+
+    def __contains__(self, name):
+        return name in self._buildings
+
+    def get(self, name):
+        """Returns the building with the given name, or None.
+        """
+        return self._buildings.get(name)
+
+    def _cell_of(self, pt):
+        """Returns the spatial index cell containing a point.
+        """
+        return (int(floor(pt[0] / self.cell_size)),
+                int(floor(pt[1] / self.cell_size)))
+
+    def _cells_of(self, cb):
+        """Returns the spatial index cells overlapped by the bounding box of
+        a building, none for a building without an outline.
+        """
+        if not cb.pts:
+            return []
+
+        min_x, min_y, max_x, max_y = building_bounding_box(cb)
+        min_col, min_row = self._cell_of((min_x, min_y))
+        max_col, max_row = self._cell_of((max_x, max_y))
+
+        return [(col, row) for col in xrange(min_col, max_col + 1)
+                for row in xrange(min_row, max_row + 1)]
+
+    def _index(self, cb):
+        """Adds a building to the spatial index and finds the hotspots
+        located within it.
+
+        Args:
+            cb: A CityBuilding.
+        """
+        # The building may have been edited in place, so its raster can be
+        # stale.
+        cb.raster = None
+        if self.raster_cell_size is not None and is_outline_closed(cb):
+            cb.raster = BuildingRaster(cb, self.raster_cell_size)
+
+        cells = self._cells_of(cb)
+        self._building_cells[cb.name] = cells
+
+        contained_hotspots = set()
+        for cell in cells:
+            self._building_grid.setdefault(cell, set()).add(cb.name)
+
+            for mac in self._hotspot_grid.get(cell, ()):
+                if is_hotspot_in_building(cb, self._hotspots[mac]):
+                    contained_hotspots.add(mac)
+
+        self._contained_hotspots[cb.name] = contained_hotspots
+
+    def _unindex(self, name):
+        """Removes a building from the spatial index.
+
+        Args:
+            name: Name of a building in the registry.
+        """
+        for cell in self._building_cells.pop(name):
+            names = self._building_grid[cell]
+            names.discard(name)
+            if not names:
+                del self._building_grid[cell]
+
+        del self._contained_hotspots[name]
+
+    def insert(self, cb):
+        """Adds a building.
+
+        Args:
+            cb: A CityBuilding whose name is not in the registry yet.
+        """
+        if cb.name in self._buildings:
+            raise KeyError("Building %s already exists" % cb.name)
+
+        self._buildings[cb.name] = cb
+        self._index(cb)
+
+    def update(self, cb):
+        """Replaces the building with the same name, for example with a
+        corrected outline. The building keeps its position in the insertion
+        order.
+
+        Args:
+            cb: A CityBuilding whose name is in the registry.
+        """
+        if cb.name not in self._buildings:
+            raise KeyError("Building %s does not exist" % cb.name)
+
+        self._unindex(cb.name)
+        self._buildings[cb.name] = cb
+        self._index(cb)
+
+    def delete(self, name):
+        """Removes a building.
+
+        Args:
+            name: Name of a building in the registry.
+
+        Returns:
+            The removed CityBuilding.
+        """
+        if name not in self._buildings:
+            raise KeyError("Building %s does not exist" % name)
+
+        self._unindex(name)
+        return self._buildings.pop(name)
+
+    def add_hotspot(self, mac, pt):
+        """Adds or moves a located hotspot.
+
+        Args:
+            mac: The MAC address of the hotspot.
+            pt: The hotspot location as a pair of numbers.
+        """
+        self.remove_hotspot(mac)
+
+        cell = self._cell_of(pt)
+        self._hotspots[mac] = pt
+        self._hotspot_grid.setdefault(cell, set()).add(mac)
+
+        for name in self._building_grid.get(cell, ()):
+            if is_hotspot_in_building(self._buildings[name], pt):
+                self._contained_hotspots[name].add(mac)
+
+    def remove_hotspot(self, mac):
+        """Removes a located hotspot, if present.
+
+        Args:
+            mac: The MAC address of the hotspot.
+        """
+        pt = self._hotspots.pop(mac, None)
+        if pt is None:
+            return
+
+        cell = self._cell_of(pt)
+        macs = self._hotspot_grid[cell]
+        macs.discard(mac)
+        if not macs:
+            del self._hotspot_grid[cell]
+
+        for name in self._building_grid.get(cell, ()):
+            self._contained_hotspots[name].discard(mac)
+
+    def add_radar_data(self, radar_data):
+        """Locates the hotspots detected in radar data and adds them.
+
+        Args:
+            radar_data: A sequence of radar data tuples as accepted by
+                hotspot_radar_locations.
+
+        Returns:
+            The compression ratio of the radar observations, as computed by
+            radar_compression_ratio.
+        """
+        radar_locations, compacted_counts = compact_radar_locations(
+            hotspot_radar_locations(radar_data))
+
+        for mac, radar_pts_and_vecs in radar_locations.iteritems():
+            hotspot_pt = resolve_hotspot_location(radar_pts_and_vecs)
+
+            if hotspot_pt is not None:
+                self.add_hotspot(mac, hotspot_pt)
+
+        return radar_compression_ratio(compacted_counts)
+
+    def buildings_with_wifi(self):
+        """Returns the buildings with confirmed hotspots, in insertion
+        order.
+        """
+        return [cb for name, cb in self._buildings.iteritems()
+                if self._contained_hotspots[name]]
@@ -9,15 +9,25 @@ Created on Oct 19, 2015
 @author: Mitchell Lee
 '''
 
+import logging
 import sys
 
+from collections import deque
+
 from itertools import izip
 
-from math import cos, sin, radians, pi
+from math import ceil, cos, sin, radians, pi
 
 # Tolerance for comparing floating point numbers.
 POINT_CMP_TOL = 1e-5
 
+# Classification of the cells of a BuildingRaster.
+CELL_OUTSIDE = 0
+CELL_INSIDE = 1
+CELL_BOUNDARY = 2
+
+logger = logging.getLogger(__name__)
+
 
 class CityBuilding(object):
     """A building from a city map. Contains functions for checking if an xy
@@ -35,6 +45,7 @@ class CityBuilding(object):
         self.name = name
         self.pts = pts
         self.has_confirmed_wifi = False
+        self.raster = None
 
 
 def is_line_segment_intersected(pt1, pt2, pt3):
@@ -94,6 +105,27 @@ def is_hotspot_in_building(cb, pt):
         True if the hotspot location resides within the building (it is not
         expected to lie on the boundary of the building), else False.
     """
+    if cb.raster is not None:
+        # Only points close to the building outline need the exact test.
+        cell = cb.raster.classify(pt)
+        if cell != CELL_BOUNDARY:
+            return cell == CELL_INSIDE
+
+    return is_hotspot_in_outline(cb, pt)
+
+
+def is_hotspot_in_outline(cb, pt):
+    """Checks if the hotspot is located within the building outline, without
+    consulting the building raster.
+
+    Args:
+        cb: A CityBuilding.
+        pt: A hotspot location.
+
+    Returns:
+        True if the hotspot location resides within the building outline,
+        else False.
+    """
     # Crossing number algorithm is used to determine if the point is within
     # the polygon defined by the building points. We check how many sides
     # of the polygon are intersected by a ray that starts at pt and has the
@@ -107,6 +139,255 @@ def is_hotspot_in_building(cb, pt):
     return len([x for x in line_segment_crossings if x]) % 2 == 1
 
 
+def building_bounding_box(cb):
+    """Computes the bounding box of a building.
+
+    Args:
+        cb: A CityBuilding with at least one outline point.
+
+    Returns:
+        A tuple containing the minimum x, minimum y, maximum x and maximum y
+        of the building outline.
+    """
+    xs = [x for x, _ in cb.pts]
+    ys = [y for _, y in cb.pts]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def is_outline_closed(cb):
+    """Checks if the outline of a building ends at its first point.
+
+    Args:
+        cb: A CityBuilding.
+
+    Returns:
+        True if the outline is closed, else False.
+    """
+    return len(cb.pts) > 0 and cb.pts[0] == cb.pts[-1]
+
+
+def containment_margin(cb):
+    """Computes how far from a building outline is_hotspot_in_building may
+    deviate from the exact outline. is_line_segment_intersected compares line
+    parameters against POINT_CMP_TOL, so points within that fraction of an
+    outline segment length from the outline may be classified either way.
+
+    The same comparison also treats a ray that passes just above or below a
+    vertex as hitting the vertex, however far left of the building the ray
+    starts, so the exact test may accept such points anywhere on the vertex
+    level. BuildingRaster and match_hotspots_to_buildings treat points
+    beyond the margin as outside instead.
+
+    Args:
+        cb: A CityBuilding.
+
+    Returns:
+        The margin as a number.
+    """
+    return 2 * POINT_CMP_TOL * max(
+        [1.0] + [max(abs(x2 - x1), abs(y2 - y1)) for (x1, y1), (x2, y2)
+                 in izip(cb.pts[:-1], cb.pts[1:])])
+
+
+def is_line_segment_in_box(pt1, pt2, box):
+    """Checks if any part of the line segment formed from pt1 to pt2 lies
+    within a box.
+
+    Args:
+        pt1: A 2D point as a pair of numbers. Starting point of the line
+            segment.
+        pt2: A 2D point as a pair of numbers. End point of the line segment.
+        box: A tuple containing the minimum x, minimum y, maximum x and
+            maximum y of the box.
+
+    Returns:
+        True if the line segment touches the box, else False.
+    """
+    x1, y1 = pt1
+    x2, y2 = pt2
+    min_x, min_y, max_x, max_y = box
+
+    # Clip the parameterized line segment against each side of the box
+    # (Liang-Barsky), the segment touches the box if anything is left.
+    t_start = 0.0
+    t_end = 1.0
+    for p, q in ((x1 - x2, x1 - min_x), (x2 - x1, max_x - x1),
+                 (y1 - y2, y1 - min_y), (y2 - y1, max_y - y1)):
+        if p == 0:
+            if q < 0:
+                # Parallel to and outside of this side of the box.
+                return False
+        else:
+            t = float(q) / p
+            if p < 0:
+                t_start = max(t_start, t)
+            else:
+                t_end = min(t_end, t)
+
+            if t_start > t_end:
+                return False
+
+    return True
+
+
+class BuildingRaster(object):
+    """Grid over a building that classifies each cell as inside, outside or
+    on the boundary of the building, so that points away from the building
+    outline can be tested with a single lookup.
+    """
+
+    def __init__(self, cb, cell_size):
+        """Constructs a new BuildingRaster.
+
+        Args:
+            cb: A CityBuilding with a closed outline. The regions of an open
+                outline are not separated by boundary cells.
+            cell_size: Width and height of a grid cell. Smaller cells need
+                more memory, but leave fewer points for the exact test.
+        """
+        if cell_size <= 0:
+            raise Exception("Cell size must be positive")
+
+        if not is_outline_closed(cb):
+            raise Exception("Outline of building %s must be closed" % cb.name)
+
+        min_x, min_y, max_x, max_y = building_bounding_box(cb)
+
+        # Cells within the margin of the outline are treated as boundary
+        # cells.
+        self.margin = containment_margin(cb)
+
+        self.cell_size = float(cell_size)
+        self.min_x = min_x - self.margin
+        self.min_y = min_y - self.margin
+        self.cols = max(1, int(ceil((max_x + self.margin - self.min_x) /
+                                    self.cell_size)))
+        self.rows = max(1, int(ceil((max_y + self.margin - self.min_y) /
+                                    self.cell_size)))
+        self.cells = bytearray(self.cols * self.rows)
+
+        is_classified = bytearray(self.cols * self.rows)
+        self._mark_boundary_cells(cb, is_classified)
+        self._classify_regions(cb, is_classified)
+
+    def _cell_box(self, col, row):
+        """Returns the box of a cell, grown by the margin.
+
+        Args:
+            col: Column of the cell.
+            row: Row of the cell.
+        """
+        x = self.min_x + col * self.cell_size
+        y = self.min_y + row * self.cell_size
+        return (x - self.margin, y - self.margin,
+                x + self.cell_size + self.margin,
+                y + self.cell_size + self.margin)
+
+    def _cell_of(self, x, y):
+        """Returns the column and row of the cell containing a point,
+        clamped to the grid.
+        """
+        col = int((x - self.min_x) / self.cell_size)
+        row = int((y - self.min_y) / self.cell_size)
+        return (min(max(col, 0), self.cols - 1),
+                min(max(row, 0), self.rows - 1))
+
+    def _mark_boundary_cells(self, cb, is_classified):
+        """Marks the cells touched by the building outline as boundary cells.
+
+        Args:
+            cb: A CityBuilding.
+            is_classified: A bytearray of flags for cells already classified.
+        """
+        for pt_a, pt_b in izip(cb.pts[:-1], cb.pts[1:]):
+            min_col, min_row = self._cell_of(
+                min(pt_a[0], pt_b[0]) - self.margin,
+                min(pt_a[1], pt_b[1]) - self.margin)
+            max_col, max_row = self._cell_of(
+                max(pt_a[0], pt_b[0]) + self.margin,
+                max(pt_a[1], pt_b[1]) + self.margin)
+
+            for row in xrange(min_row, max_row + 1):
+                for col in xrange(min_col, max_col + 1):
+                    index = row * self.cols + col
+                    if (not is_classified[index] and
+                            is_line_segment_in_box(pt_a, pt_b,
+                                                   self._cell_box(col, row))):
+                        self.cells[index] = CELL_BOUNDARY
+                        is_classified[index] = True
+
+    def _classify_regions(self, cb, is_classified):
+        """Classifies the remaining cells. Cells that are connected without
+        crossing a boundary cell are all inside or all outside, so only one
+        exact test is needed per connected region.
+
+        Args:
+            cb: A CityBuilding.
+            is_classified: A bytearray of flags for cells already classified.
+        """
+        for seed in xrange(len(self.cells)):
+            if is_classified[seed]:
+                continue
+
+            col, row = seed % self.cols, seed // self.cols
+            center = (self.min_x + (col + 0.5) * self.cell_size,
+                      self.min_y + (row + 0.5) * self.cell_size)
+            cell = (CELL_INSIDE if is_hotspot_in_outline(cb, center)
+                    else CELL_OUTSIDE)
+
+            is_classified[seed] = True
+            region = deque([seed])
+            while region:
+                index = region.popleft()
+                self.cells[index] = cell
+                col, row = index % self.cols, index // self.cols
+
+                for neighbor_col, neighbor_row in ((col - 1, row),
+                                                   (col + 1, row),
+                                                   (col, row - 1),
+                                                   (col, row + 1)):
+                    if (0 <= neighbor_col < self.cols and
+                            0 <= neighbor_row < self.rows):
+                        neighbor = neighbor_row * self.cols + neighbor_col
+                        if not is_classified[neighbor]:
+                            is_classified[neighbor] = True
+                            region.append(neighbor)
+
+    def classify(self, pt):
+        """Classifies a point by the cell it lies in.
+
+        Args:
+            pt: A 2D point as a pair of numbers.
+
+        Returns:
+            CELL_INSIDE or CELL_OUTSIDE if the point is known to be inside or
+            outside of the building, else CELL_BOUNDARY.
+        """
+        x, y = pt
+        col = int((x - self.min_x) // self.cell_size)
+        row = int((y - self.min_y) // self.cell_size)
+
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.cells[row * self.cols + col]
+        else:
+            return CELL_OUTSIDE
+
+
+def rasterize_buildings(all_buildings, cell_size):
+    """Precomputes a BuildingRaster for each building, which
+    is_hotspot_in_building then uses to avoid most exact tests. Buildings
+    with an open outline are left without a raster and always use the exact
+    test.
+
+    Args:
+        all_buildings: A sequence of CityBuildings.
+        cell_size: Width and height of a grid cell.
+    """
+    for cb in all_buildings:
+        cb.raster = (BuildingRaster(cb, cell_size) if is_outline_closed(cb)
+                     else None)
+
+
 def azimuth_to_vector(azi_deg):
     """Converts an azimuth to a vector.
 
@@ -148,6 +429,87 @@ def hotspot_radar_locations(radar_data):
     return radar_locations
 
 
+def compact_radar_locations(radar_locations, tol=POINT_CMP_TOL):
+    """Collapses duplicate radar observations of each MAC address, such as
+    the ones recorded while the Wi-Fi car waits at a traffic light. Two
+    observations are duplicates if their radar points and direction vectors
+    differ by less than tol in each coordinate. Since hotspot_location treats
+    direction vectors within POINT_CMP_TOL of each other as parallel, a
+    duplicate never helps to locate a hotspot.
+
+    Args:
+        radar_locations: A dictionary as returned by hotspot_radar_locations.
+        tol: Tolerance for comparing observations.
+
+    Returns:
+        A pair of dictionaries keyed by MAC address. The first has the same
+        form as radar_locations, but only contains the first observation of
+        each group of duplicates. The second contains, for each kept
+        observation, the number of observations it stands for.
+    """
+    compacted_locations = {}
+    compacted_counts = {}
+
+    for mac, radar_pts_and_vecs in radar_locations.iteritems():
+        kept = []
+        counts = []
+
+        # Indices of the kept observations, by the grid cell of size tol
+        # containing their radar point. Duplicates lie in the same or an
+        # adjacent cell.
+        kept_by_cell = {}
+
+        for pt, dxdy in radar_pts_and_vecs:
+            col = int(pt[0] // tol)
+            row = int(pt[1] // tol)
+            duplicate_index = None
+
+            for neighbor_cell in ((col + dcol, row + drow)
+                                  for dcol in (-1, 0, 1)
+                                  for drow in (-1, 0, 1)):
+                for index in kept_by_cell.get(neighbor_cell, ()):
+                    kept_pt, kept_dxdy = kept[index]
+                    if (abs(kept_pt[0] - pt[0]) < tol and
+                            abs(kept_pt[1] - pt[1]) < tol and
+                            abs(kept_dxdy[0] - dxdy[0]) < tol and
+                            abs(kept_dxdy[1] - dxdy[1]) < tol):
+                        duplicate_index = index
+                        break
+
+                if duplicate_index is not None:
+                    break
+
+            if duplicate_index is None:
+                kept_by_cell.setdefault((col, row), []).append(len(kept))
+                kept.append((pt, dxdy))
+                counts.append(1)
+            else:
+                counts[duplicate_index] += 1
+
+        compacted_locations[mac] = kept
+        compacted_counts[mac] = counts
+
+    return compacted_locations, compacted_counts
+
+
+def radar_compression_ratio(compacted_counts):
+    """Computes how much compact_radar_locations reduced the number of radar
+    observations.
+
+    Args:
+        compacted_counts: The observation counts returned by
+            compact_radar_locations.
+
+    Returns:
+        The number of original observations divided by the number of kept
+        observations, or 1.0 if there are no observations.
+    """
+    kept = sum(len(counts) for counts in compacted_counts.itervalues())
+    total = sum(sum(counts) for counts in compacted_counts.itervalues())
+
+    return float(total) / kept if kept else 1.0
+
+
 def hotspot_location(pt1, dxdy1, pt2, dxdy2):
     """Computes the intersection of two radar lines. Each line consists of
     a point where the Wi-Fi radar was at when a hotspot was detected and
@@ -202,85 +564,283 @@ def hotspot_location(pt1, dxdy1, pt2, dxdy2):
             y_inter = m1 * x_inter + b1
             return x_inter, y_inter
 
-if __name__ == "__main__":
-    # Parse input
-    city_map_and_wifi_data_fh = open(sys.argv[1], 'r')
 
+def parse_building(line):
+    """Parses a city map line describing a building.
+
+    Args:
+        line: A string containing a building name followed by the building
+            outline points, where each point is formatted as "x;y".
+
+    Returns:
+        A CityBuilding.
+    """
+    building_name_and_pts = line.split(" ")
+
+    # Extract building name and points from the line
+    building_name = building_name_and_pts[0]
+    building_pts = [(float(pt_str.split(";")[0]),
+                     float(pt_str.split(";")[1])) for pt_str
+                    in building_name_and_pts[1:]]
+
+    return CityBuilding(building_name, building_pts)
+
+
+def parse_radar_data(line):
+    """Parses a line of Wi-Fi radar data.
+
+    Args:
+        line: A string containing a radar point formatted as "x;y" followed
+            by MAC addresses and azimuths formatted as "mac;azimuth".
+
+    Returns:
+        A tuple containing the radar point and a sequence of pairs containing
+        a MAC address as a string and azimuth as a number.
+    """
+    radar_pt_and_mac_addresses = line.split(" ")
+
+    # Extract radar point
+    radar_pt_str = radar_pt_and_mac_addresses[0]
+    radar_pt = (float(radar_pt_str.split(";")[0]),
+                float(radar_pt_str.split(";")[1]))
+
+    # Extract mac addresses/azimuths
+    mac_addresses = [(mac_str.split(";")[0],
+                      float(mac_str.split(";")[1])) for
+                     mac_str in radar_pt_and_mac_addresses[1:]]
+
+    return radar_pt, mac_addresses
+
+
+def parse_city_map_and_radar_data(lines):
+    """Parses a city map followed by Wi-Fi radar data. The city map and
+    radar data are separated by an empty line, the radar data may be
+    omitted.
+
+    Args:
+        lines: An iterable of strings, such as an open file.
+
+    Returns:
+        A pair containing a list of CityBuildings and a list of radar data
+        tuples as returned by parse_radar_data.
+    """
     all_buildings = []
     radar_data = []
     is_city_map_parsed = False
 
-    for line in city_map_and_wifi_data_fh:
+    for line in lines:
         if line == "\n":
             # Switching from building info lines to radar data
             is_city_map_parsed = True
         elif not is_city_map_parsed:
             # Current line contains building info
-            building_name_and_pts = line.split(" ")
-
-            # Extract building name and points from the line
-            building_name = building_name_and_pts[0]
-            building_pts = [(float(pt_str.split(";")[0]),
-                             float(pt_str.split(";")[1])) for pt_str
-                            in building_name_and_pts[1:]]
-
-            all_buildings.append(CityBuilding(building_name, building_pts))
+            all_buildings.append(parse_building(line))
         else:
             # Current line contains radar data
-            radar_pt_and_mac_addresses = line.split(" ")
+            radar_data.append(parse_radar_data(line))
 
-            # Extract radar point
-            radar_pt_str = radar_pt_and_mac_addresses[0]
-            radar_pt = (float(radar_pt_str.split(";")[0]),
-                        float(radar_pt_str.split(";")[1]))
+    return all_buildings, radar_data
 
-            # Extract mac addresses/azimuths
-            mac_addresses = [(mac_str.split(";")[0],
-                              float(mac_str.split(";")[1])) for
-                             mac_str in radar_pt_and_mac_addresses[1:]]
 
-            radar_data.append((radar_pt, mac_addresses))
+def resolve_hotspot_location(radar_pts_and_vecs):
+    """Determines the physical location of a MAC address from its radar
+    points and direction vectors.
 
-    city_map_and_wifi_data_fh.close()
+    Args:
+        radar_pts_and_vecs: A sequence of pairs containing a 2D radar point
+            and a direction vector to a hotspot, as returned by
+            hotspot_radar_locations for a single MAC address.
 
-    # Check for buildings with hotspots.
-    hotspot_radar_lookup = hotspot_radar_locations(radar_data)
+    Returns:
+        The hotspot location as a pair of numbers, or None if the location
+        cannot be determined.
+    """
+    if len(radar_pts_and_vecs) < 2:
+        # If less than two data points are available for a particular
+        # MAC address then there's no way to pin-point its location.
+        return None
+
+    pt1, dxdy1 = radar_pts_and_vecs[0]
+    hotspot_pt = None
+
+    # Loop over until we find two radar lines that intersect. If we're
+    # really unlucky, the Wi-Fi car might detect a MAC address and
+    # then drive in one direction until the MAC address signal fades.
+    # In this case all of the radar lines will point in the same
+    # direction and we can't use two intersecting radar lines to
+    # pin-point the physical hotspot location.
+    for pt2, dxdy2 in radar_pts_and_vecs[1:]:
+        hotspot_pt = hotspot_location(pt1, dxdy1, pt2, dxdy2)
+
+        if hotspot_pt is not None:
+            break
+
+    return hotspot_pt
+
+
+def _spread_bits(value):
+    """Spreads the lower 32 bits of a number out to the even bits.
+    """
+    value &= 0xFFFFFFFF
+    value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+    value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+    value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value << 2)) & 0x3333333333333333
+    value = (value | (value << 1)) & 0x5555555555555555
+    return value
+
+
+def z_order_index(col, row):
+    """Computes the position of a grid cell along the Z-order curve, which
+    keeps cells that are close together in the grid mostly close together
+    along the curve.
+
+    Args:
+        col: Non-negative column of the cell.
+        row: Non-negative row of the cell.
+
+    Returns:
+        The Z-order index as an integer.
+    """
+    return _spread_bits(col) | (_spread_bits(row) << 1)
+
+
+def match_hotspots_to_buildings(hotspot_pts, all_buildings, cell_size=None):
+    """Determines which buildings contain at least one of a batch of hotspot
+    locations. The hotspots are grouped by grid cell and the cells are
+    visited along a Z-order curve, testing each group against only the
+    buildings whose bounding box overlaps the cell. Consecutive tests thus
+    touch the same buildings, and each building is set up once per batch
+    rather than once per hotspot.
 
-    for mac_address, radar_pts_and_vecs in hotspot_radar_lookup.iteritems():
-        if len(radar_pts_and_vecs) < 2:
-            # If less than two data points are available for a particular
-            # MAC address then there's no way to pin-point its location.
+    Hotspots farther than containment_margin from the bounding box of a
+    building are never matched to it, even where is_hotspot_in_building
+    would accept them because they lie level with a vertex of the outline.
+
+    Args:
+        hotspot_pts: A sequence of hotspot locations as pairs of numbers.
+        all_buildings: A sequence of CityBuildings.
+        cell_size: Width and height of a grid cell. Defaults to a size that
+            puts a few hotspots in each cell.
+
+    Returns:
+        A list of CityBuildings that contain a hotspot, in the same order
+        as all_buildings.
+    """
+    if not hotspot_pts or not all_buildings:
+        return []
+
+    min_x = min(x for x, _ in hotspot_pts)
+    min_y = min(y for _, y in hotspot_pts)
+
+    if cell_size is None:
+        extent = max(max(x for x, _ in hotspot_pts) - min_x,
+                     max(y for _, y in hotspot_pts) - min_y)
+        cell_size = extent / max(1, int(len(hotspot_pts) ** 0.5)) or 1.0
+
+    def cell_of(x, y):
+        return int((x - min_x) // cell_size), int((y - min_y) // cell_size)
+
+    # Group the hotspots by cell.
+    cell_pts = {}
+    for pt in hotspot_pts:
+        cell_pts.setdefault(cell_of(*pt), []).append(pt)
+
+    # Buildings overlapping each occupied cell, with their bounding box
+    # grown by the containment margin.
+    cell_buildings = {}
+    search_boxes = {}
+    for index, cb in enumerate(all_buildings):
+        if not cb.pts:
+            # A building without an outline contains no hotspots.
             continue
+
+        margin = containment_margin(cb)
+        b_min_x, b_min_y, b_max_x, b_max_y = building_bounding_box(cb)
+        search_box = (b_min_x - margin, b_min_y - margin,
+                      b_max_x + margin, b_max_y + margin)
+        search_boxes[index] = search_box
+
+        min_col, min_row = cell_of(search_box[0], search_box[1])
+        max_col, max_row = cell_of(search_box[2], search_box[3])
+
+        if (max_col - min_col + 1) * (max_row - min_row + 1) <= len(cell_pts):
+            overlapped_cells = [(col, row)
+                                for col in xrange(min_col, max_col + 1)
+                                for row in xrange(min_row, max_row + 1)
+                                if (col, row) in cell_pts]
         else:
-            # Determine the physical location of the MAC address.
-            pt1, dxdy1 = radar_pts_and_vecs[0]
-            hotspot_pt = None
-
-            # Loop over until we find two radar lines that intersect. If we're
-            # really unlucky, the Wi-Fi car might detect a MAC address and
-            # then drive in one direction until the MAC address signal fades.
-            # In this case all of the radar lines will point in the same
-            # direction and we can't use two intersecting radar lines to
-            # pin-point the physical hotspot location.
-            for pt2, dxdy2 in radar_pts_and_vecs[1:]:
-                hotspot_pt = hotspot_location(pt1, dxdy1, pt2, dxdy2)
-
-                if hotspot_pt is not None:
+            overlapped_cells = [(col, row) for col, row in cell_pts
+                                if min_col <= col <= max_col and
+                                min_row <= row <= max_row]
+
+        for cell in overlapped_cells:
+            cell_buildings.setdefault(cell, []).append(index)
+
+    # Visit the cells in Z-order.
+    confirmed = set()
+    for cell in sorted(cell_buildings, key=lambda cell: z_order_index(*cell)):
+        for index in cell_buildings[cell]:
+            if index in confirmed:
+                continue
+
+            cb = all_buildings[index]
+            s_min_x, s_min_y, s_max_x, s_max_y = search_boxes[index]
+
+            for pt in cell_pts[cell]:
+                if (s_min_x <= pt[0] <= s_max_x and
+                        s_min_y <= pt[1] <= s_max_y and
+                        is_hotspot_in_building(cb, pt)):
+                    confirmed.add(index)
                     break
 
-            if hotspot_pt is None:
-                # Could not determine the physical location of this MAC
-                # address.
-                continue
-            else:
-                # Check if a building contains this hotspot.
-                for cb in all_buildings:
-                    if (not cb.has_confirmed_wifi and
-                            is_hotspot_in_building(cb, hotspot_pt)):
-                        cb.has_confirmed_wifi = True
+    return [cb for index, cb in enumerate(all_buildings) if index in confirmed]
+
+
+def find_buildings_with_wifi(all_buildings, radar_data):
+    """Determines which buildings contain a Wi-Fi hotspot. The buildings are
+    not modified, so the same buildings may be searched concurrently.
+
+    Args:
+        all_buildings: A sequence of CityBuildings.
+        radar_data: A sequence of radar data tuples as accepted by
+            hotspot_radar_locations.
+
+    Returns:
+        A list of CityBuildings with confirmed hotspots, in the same order
+        as all_buildings.
+    """
+    hotspot_radar_lookup, compacted_counts = compact_radar_locations(
+        hotspot_radar_locations(radar_data))
+    logger.info("Compacted radar observations by a factor of %.2f",
+                radar_compression_ratio(compacted_counts))
+
+    # Determine the physical location of each MAC address, skipping the ones
+    # that could not be located.
+    hotspot_pts = [hotspot_pt for hotspot_pt
+                   in (resolve_hotspot_location(radar_pts_and_vecs)
+                       for radar_pts_and_vecs
+                       in hotspot_radar_lookup.itervalues())
+                   if hotspot_pt is not None]
+
+    return match_hotspots_to_buildings(hotspot_pts, all_buildings)
+
+
+if __name__ == "__main__":
+    # Parse input
+    with open(sys.argv[1], 'r') as city_map_and_wifi_data_fh:
+        all_buildings, radar_data = parse_city_map_and_radar_data(
+            city_map_and_wifi_data_fh)
+
+    if len(sys.argv) > 2:
+        # Optional raster cell size for faster containment tests.
+        rasterize_buildings(all_buildings, float(sys.argv[2]))
+
+    # Check for buildings with hotspots.
+    for cb in find_buildings_with_wifi(all_buildings, radar_data):
+        cb.has_confirmed_wifi = True
 
     # Report out all buildings which have confirmed hotspots.
     for cb in all_buildings:
         if cb.has_confirmed_wifi:
             print cb.name
-            
\ No newline at end of file
@@ -0,0 +1,235 @@
+'''
+Long-running service that keeps a city map loaded and answers Wi-Fi radar
+queries from local clients, avoiding the cost of starting Python and parsing
+the city map for every query.
+
+Clients connect over a Unix socket or a localhost TCP port and send batches
+of radar data lines (the same format as the radar section of a wifi_search
+input file), each batch terminated by an empty line. The server replies with
+the names of the buildings with confirmed hotspots, one per line, followed by
+an empty line. Sending the line "RELOAD" re-reads the city map from disk.
+
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+import logging
+import os
+import signal
+import SocketServer
+import stat
+import threading
+
+from wifi_search import (parse_city_map_and_radar_data, parse_radar_data,
+                         find_buildings_with_wifi, rasterize_buildings)
+
+# Command that makes the server re-read its city map.
+RELOAD_COMMAND = "RELOAD"
+
+# Errors raised when a city map is missing, unreadable or malformed.
+CITY_MAP_ERRORS = (EnvironmentError, IndexError, ValueError)
+
+logger = logging.getLogger(__name__)
+
+
+class CityIndex(object):
+    """Holds the parsed buildings of a city map so that they can be shared
+    between concurrent queries and replaced without restarting the server.
+    """
+
+    def __init__(self, city_map_path, cell_size=None):
+        """Constructs a new CityIndex and loads the city map.
+
+        Args:
+            city_map_path: Path to a file containing a city map, optionally
+                followed by radar data which is ignored.
+            cell_size: Cell size of the building rasters, or None to test
+                hotspots against the building outlines only.
+        """
+        self.city_map_path = city_map_path
+        self.cell_size = cell_size
+        self.buildings = []
+        self._reload_lock = threading.Lock()
+        self.reload()
+
+    def reload(self):
+        """Re-reads the city map from disk. Queries that are already running
+        keep using the buildings they started with. If the city map cannot
+        be read, the previous buildings are kept and the error is raised.
+
+        Returns:
+            The number of buildings in the reloaded city map.
+        """
+        with self._reload_lock:
+            with open(self.city_map_path, 'r') as city_map_fh:
+                all_buildings, _ = parse_city_map_and_radar_data(city_map_fh)
+
+            if self.cell_size is not None:
+                rasterize_buildings(all_buildings, self.cell_size)
+
+            # Replacing the list reference is atomic, so readers never see a
+            # partially loaded city map.
+            self.buildings = all_buildings
+            return len(all_buildings)
+
+    def find_buildings_with_wifi(self, radar_data):
+        """Determines which buildings of the current city map contain a Wi-Fi
+        hotspot.
+
+        Args:
+            radar_data: A sequence of radar data tuples.
+
+        Returns:
+            A list of building names with confirmed hotspots.
+        """
+        return [cb.name for cb in
+                find_buildings_with_wifi(self.buildings, radar_data)]
+
+
+class RadarRequestHandler(SocketServer.StreamRequestHandler):
+    """Answers radar batches sent by a single client connection.
+    """
+
+    def handle(self):
+        """Reads radar batches until the client closes the connection.
+        """
+        batch = []
+
+        for line in iter(self.rfile.readline, ""):
+            if line.strip() == RELOAD_COMMAND:
+                self._reload()
+            elif line.strip() == "":
+                self._answer_batch(batch)
+                batch = []
+            else:
+                batch.append(line.rstrip("\r\n"))
+
+        if batch:
+            # The client closed its side of the connection without
+            # terminating the last batch.
+            self._answer_batch(batch)
+
+    def _reload(self):
+        """Reloads the city map and replies with the number of buildings, or
+        with the error if the city map could not be read.
+        """
+        try:
+            building_count = self.server.city_index.reload()
+        except CITY_MAP_ERRORS as e:
+            logger.error("Could not reload city map: %s", e)
+            self._reply(["ERROR %s" % e])
+            return
+
+        self._reply(["RELOADED %d" % building_count])
+
+    def _answer_batch(self, batch):
+        """Replies with the buildings that have hotspots according to a batch
+        of radar data lines.
+
+        Args:
+            batch: A list of radar data lines.
+        """
+        try:
+            radar_data = [parse_radar_data(line) for line in batch]
+        except (IndexError, ValueError) as e:
+            self._reply(["ERROR %s" % e])
+            return
+
+        self._reply(self.server.city_index.find_buildings_with_wifi(
+            radar_data))
+
+    def _reply(self, lines):
+        """Sends a response terminated by an empty line.
+
+        Args:
+            lines: A sequence of strings.
+        """
+        self.wfile.write("".join(line + "\n" for line in lines) + "\n")
+        self.wfile.flush()
+
+
+class ThreadedTCPServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
+    """TCP server that handles each client in its own thread.
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class ThreadedUnixServer(SocketServer.ThreadingMixIn,
+                         SocketServer.UnixStreamServer):
+    """Unix socket server that handles each client in its own thread.
+    """
+    daemon_threads = True
+
+
+def create_server(city_index, address):
+    """Creates a server that answers radar queries against a city map.
+
+    Args:
+        city_index: A CityIndex.
+        address: Either a filesystem path for a Unix socket, or a pair
+            containing a host and port for a TCP socket. An existing file
+            at the path is only replaced if it is a socket.
+
+    Returns:
+        A SocketServer.BaseServer, call serve_forever to start serving.
+    """
+    if isinstance(address, basestring):
+        if os.path.exists(address):
+            if not stat.S_ISSOCK(os.stat(address).st_mode):
+                raise Exception("%s exists and is not a socket" % address)
+
+            # Remove a stale socket left behind by a previous server.
+            os.remove(address)
+
+        server = ThreadedUnixServer(address, RadarRequestHandler)
+    else:
+        server = ThreadedTCPServer(address, RadarRequestHandler)
+
+    server.city_index = city_index
+    return server
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Serve Wi-Fi radar queries against a city map.")
+    parser.add_argument("city_map", help="Path to the city map file.")
+    parser.add_argument("--socket", help="Path of a Unix socket to listen on.")
+    parser.add_argument("--port", type=int, default=8159,
+                        help="Localhost TCP port to listen on when no Unix "
+                        "socket is given.")
+    parser.add_argument("--cell-size", type=float,
+                        help="Rasterize buildings with this cell size for "
+                        "faster hotspot tests.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Log how much duplicate radar data each batch "
+                        "contains.")
+    args = parser.parse_args()
+
+    city_index = CityIndex(args.city_map, args.cell_size)
+    server = create_server(city_index,
+                           args.socket or ("127.0.0.1", args.port))
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(message)s")
+
+    def reload_on_signal(signum, frame):
+        """Reloads the city map on SIGHUP, like the RELOAD command.
+        """
+        try:
+            city_index.reload()
+        except CITY_MAP_ERRORS as e:
+            logger.error("Could not reload city map: %s", e)
+
+    signal.signal(signal.SIGHUP, reload_on_signal)
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if args.socket:
+            os.remove(args.socket)
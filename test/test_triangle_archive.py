@@ -0,0 +1,77 @@
+'''
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import triangle_archive
+
+
+class TestTriangleArchive(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.archive_path = os.path.join(self.temp_dir, "triangles.tarc")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_read_text_triangles(self):
+        """Tests that concatenated text triangles are split correctly.
+        """
+        lines = ["5\n", "9 6\n", "\n", "1\n", "7\n", "2 3\n"]
+
+        actual_triangles = list(triangle_archive.read_text_triangles(lines))
+        expected_triangles = [[[5], [9, 6]], [[1]], [[7], [2, 3]]]
+        self.assertEqual(actual_triangles,
+                         expected_triangles,
+                         "Expected triangles (%s) differ from actual (%s)"
+                         % (expected_triangles, actual_triangles))
+
+    def test_write_and_read_archive(self):
+        """Tests reading triangles by ID from an archive.
+        """
+        triangles = [[[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]],
+                     [[-3]],
+                     [[1], [2, 3]]]
+
+        triangle_count = triangle_archive.write_archive(self.archive_path,
+                                                        triangles)
+        self.assertEqual(triangle_count, 3,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (3, triangle_count))
+
+        with triangle_archive.TriangleArchive(self.archive_path) as archive:
+            self.assertEqual(len(archive), 3,
+                             "Expected value (%d) differs from actual (%d)"
+                             % (3, len(archive)))
+
+            for triangle_id in (2, 0, 1):
+                actual_nums = archive.read_triangle(triangle_id)
+                self.assertEqual(actual_nums,
+                                 triangles[triangle_id],
+                                 "Expected triangle (%s) differs from actual "
+                                 "(%s)" % (triangles[triangle_id],
+                                           actual_nums))
+
+            actual_sums = list(archive.solve([2, 0]))
+            self.assertEqual(actual_sums,
+                             [(2, 4), (0, 27)],
+                             "Expected sums (%s) differ from actual (%s)"
+                             % ([(2, 4), (0, 27)], actual_sums))
+
+            self.assertRaises(IndexError, archive.read_triangle, 3)
+
+    def test_invalid_archive(self):
+        """Tests that files that are not archives are rejected.
+        """
+        with open(self.archive_path, 'wb') as archive_fh:
+            archive_fh.write("not a triangle archive, but long enough")
+
+        self.assertRaises(Exception, triangle_archive.TriangleArchive,
+                          self.archive_path)
@@ -0,0 +1,118 @@
+'''
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import triangle_cache
+
+
+class TestTriangleCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_triangle_key(self):
+        """Tests that the triangle_key function depends on the numbers and
+        the engine version only.
+        """
+        nums = [[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]]
+
+        self.assertEqual(triangle_cache.triangle_key(nums),
+                         triangle_cache.triangle_key([list(x) for x in nums]),
+                         "Expected equal triangles to have equal keys")
+        self.assertNotEqual(triangle_cache.triangle_key(nums),
+                            triangle_cache.triangle_key([[5], [9, 6]]),
+                            "Expected different triangles to have different "
+                            "keys")
+        self.assertNotEqual(triangle_cache.triangle_key(nums, "1"),
+                            triangle_cache.triangle_key(nums, "2"),
+                            "Expected different engine versions to have "
+                            "different keys")
+
+    def test_get_and_put(self):
+        """Tests storing and looking up results.
+        """
+        cache = triangle_cache.TriangleCache(self.cache_dir)
+
+        self.assertEqual(cache.get("a"), None,
+                         "Expected a missing result to return None")
+
+        cache.put("a", 27)
+        result = cache.get("a")
+        self.assertEqual(result["max_sum"], 27,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (27, result["max_sum"]))
+        self.assertEqual(cache.get("a", with_path=True), None,
+                         "Expected a result without a path to be missing "
+                         "when a path is requested")
+
+        cache.put("a", 27, [0, 0, 1, 1])
+        result = cache.get("a", with_path=True)
+        self.assertEqual(result["path"], [0, 0, 1, 1],
+                         "Expected path (%s) differs from actual (%s)"
+                         % ([0, 0, 1, 1], result["path"]))
+
+    def test_get_evicted_concurrently(self):
+        """Tests that a result is still returned when another process evicts
+        it right after it was read.
+        """
+        cache = triangle_cache.TriangleCache(self.cache_dir)
+        cache.put("a", 27)
+
+        def utime(path, times):
+            os.remove(path)
+            raise OSError("No such file or directory: %s" % path)
+
+        real_utime = triangle_cache.os.utime
+        triangle_cache.os.utime = utime
+        try:
+            result = cache.get("a")
+        finally:
+            triangle_cache.os.utime = real_utime
+
+        self.assertEqual(result["max_sum"], 27,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (27, result["max_sum"]))
+
+    def test_lru_eviction(self):
+        """Tests that the least recently used results are evicted when the
+        cache exceeds its size limit.
+        """
+        cache = triangle_cache.TriangleCache(self.cache_dir)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        entry_size = os.path.getsize(os.path.join(self.cache_dir, "a.json"))
+
+        # Make "b" the least recently used result.
+        os.utime(os.path.join(self.cache_dir, "a.json"), (2000, 2000))
+        os.utime(os.path.join(self.cache_dir, "b.json"), (1000, 1000))
+
+        cache.max_bytes = 2 * entry_size
+        cache.put("c", 3)
+
+        self.assertEqual(cache.get("b"), None,
+                         "Expected the least recently used result to be "
+                         "evicted")
+        self.assertEqual(cache.get("a")["max_sum"], 1,
+                         "Expected a recently used result to be kept")
+        self.assertEqual(cache.get("c")["max_sum"], 3,
+                         "Expected the newest result to be kept")
+
+    def test_clear(self):
+        """Tests that clear removes all results.
+        """
+        cache = triangle_cache.TriangleCache(self.cache_dir)
+        cache.put("a", 1)
+        cache.clear()
+
+        self.assertEqual(cache.get("a"), None,
+                         "Expected no results after clearing the cache")
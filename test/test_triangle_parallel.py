@@ -0,0 +1,67 @@
+'''
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+
+import random
+import unittest
+
+import triangle_parallel
+import triangle_search
+
+
+class TestTriangleParallel(unittest.TestCase):
+    def test_find_max_sum_parallel(self):
+        """Tests the find_max_sum_parallel function against the serial
+        engine, with thresholds small enough to use the worker processes.
+        """
+        rand = random.Random(27)
+        nums = [[rand.randint(-50, 100) for _ in range(row + 1)]
+                for row in range(60)]
+
+        expected_max_sum = triangle_search.find_max_sum_rows(nums)
+        actual_max_sum = triangle_parallel.find_max_sum_parallel(
+            nums, processes=2, min_parallel_rows=1, chunk_width=7,
+            block_rows=5)
+        self.assertEqual(actual_max_sum,
+                         expected_max_sum,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (expected_max_sum, actual_max_sum))
+
+    def test_find_max_sum_parallel_serial_fallback(self):
+        """Tests that the find_max_sum_parallel function solves small
+        triangles serially.
+        """
+        nums = [[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]]
+
+        actual_max_sum = triangle_parallel.find_max_sum_parallel(nums)
+        self.assertEqual(actual_max_sum,
+                         27,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (27, actual_max_sum))
+
+    def test_find_max_sum_parallel_single_row(self):
+        """Tests the find_max_sum_parallel function with a single row.
+        """
+        actual_max_sum = triangle_parallel.find_max_sum_parallel(
+            [[42]], processes=2, min_parallel_rows=1, chunk_width=1)
+        self.assertEqual(actual_max_sum,
+                         42,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (42, actual_max_sum))
+
+    def test_find_max_sum_parallel_overflow(self):
+        """Tests that the find_max_sum_parallel function solves triangles
+        whose sums do not fit in a C long serially, instead of wrapping
+        around.
+        """
+        nums = [[10 ** 16] * (row + 1) for row in range(2000)]
+
+        actual_max_sum = triangle_parallel.find_max_sum_parallel(
+            nums, processes=2, min_parallel_rows=1, chunk_width=7)
+        self.assertEqual(actual_max_sum,
+                         2 * 10 ** 19,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (2 * 10 ** 19, actual_max_sum))
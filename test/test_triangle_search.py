@@ -5,9 +5,14 @@ Created on Jan 2, 2017
 '''
 
 
+import os
+import random
+import shutil
+import tempfile
 import unittest
 
 import triangle_search
+import triangle_table
 
 
 class TestTriangleSearch(unittest.TestCase):
@@ -47,4 +52,172 @@ class TestTriangleSearch(unittest.TestCase):
         self.assertEqual(actual_max_sum,
                          27,
                          "Expected value (%d) differs from actual (%d)"
-                         % (27, actual_max_sum))
\ No newline at end of file
+                         % (27, actual_max_sum))
+
+    def test_find_max_sum_rows(self):
+        """Tests the find_max_sum_rows function.
+        """
+        nums = [[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]]
+
+        actual_max_sum = triangle_search.find_max_sum_rows(nums)
+        self.assertEqual(actual_max_sum,
+                         27,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (27, actual_max_sum))
+
+    def test_find_max_path(self):
+        """Tests the find_max_path function.
+        """
+        nums = [[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]]
+        num_tree = triangle_search.create_num_tree(nums)
+
+        actual_path = triangle_search.find_max_path(num_tree)
+        self.assertEqual(actual_path,
+                         [0, 0, 1, 1],
+                         "Expected path (%s) differs from actual (%s)"
+                         % ([0, 0, 1, 1], actual_path))
+
+    def test_parse_triangle(self):
+        """Tests the parse_triangle function.
+        """
+        actual_nums = triangle_search.parse_triangle(["5\n", " 9  6\n", "\n"])
+        self.assertEqual(actual_nums,
+                         [[5], [9, 6]],
+                         "Expected triangle (%s) differs from actual (%s)"
+                         % ([[5], [9, 6]], actual_nums))
+
+    def test_choose_engine(self):
+        """Tests the choose_engine function.
+        """
+        expected_engines = [((4, False, None, False), "tree"),
+                            ((4, True, None, False), "tree"),
+                            ((500, False, None, False), "rows"),
+                            ((500, True, None, False), "rows"),
+                            ((500, True, 10 ** 6, True), "stream"),
+                            ((500, False, 10 ** 3, False), "rows")]
+
+        for args, expected_engine in expected_engines:
+            choice = triangle_search.choose_engine(*args)
+            self.assertEqual(choice.engine,
+                             expected_engine,
+                             "Expected engine (%s) differs from actual (%s) "
+                             "for arguments %s"
+                             % (expected_engine, choice.engine, args))
+            self.assertTrue(choice.reason,
+                            "Expected a reason for choosing the %s engine"
+                            % choice.engine)
+
+        # The parallel engine needs several CPUs and sums that fit in a C
+        # long.
+        cpu_count = triangle_search.multiprocessing.cpu_count
+        try:
+            for cpus, max_abs_value, expected_engine in (
+                    (8, 99, "parallel"), (8, None, "rows"),
+                    (8, 10 ** 16, "rows"), (2, 99, "rows")):
+                triangle_search.multiprocessing.cpu_count = lambda: cpus
+                choice = triangle_search.choose_engine(
+                    20000, max_abs_value=max_abs_value)
+                self.assertEqual(choice.engine,
+                                 expected_engine,
+                                 "Expected engine (%s) differs from actual "
+                                 "(%s) for %d CPUs and values up to %s"
+                                 % (expected_engine, choice.engine, cpus,
+                                    max_abs_value))
+        finally:
+            triangle_search.multiprocessing.cpu_count = cpu_count
+
+    def test_find_max_sum_engines(self):
+        """Tests the find_max_sum and find_max_path functions with each
+        engine that works on a triangle in memory.
+        """
+        nums = [[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]]
+
+        for engine in ("auto", "tree", "rows", "table", "parallel"):
+            actual_max_sum = triangle_search.find_max_sum(nums, engine)
+            self.assertEqual(actual_max_sum,
+                             27,
+                             "Expected value (%d) differs from actual (%d) "
+                             "for the %s engine"
+                             % (27, actual_max_sum, engine))
+
+        for engine in ("auto", "tree", "rows", "table"):
+            actual_path = triangle_search.find_max_path(nums, engine)
+            self.assertEqual(actual_path,
+                             [0, 0, 1, 1],
+                             "Expected path (%s) differs from actual (%s) "
+                             "for the %s engine"
+                             % ([0, 0, 1, 1], actual_path, engine))
+
+        self.assertRaises(Exception, triangle_search.find_max_path, nums,
+                          "parallel")
+        self.assertRaises(Exception, triangle_search.find_max_sum, nums,
+                          "stream")
+
+    def test_find_max_path_large_values(self):
+        """Tests the find_max_path function with sums that do not fit in a
+        C long.
+        """
+        rand = random.Random(37)
+        nums = [[rand.randint(-10 ** 17, 10 ** 17) for _ in range(row + 1)]
+                for row in range(300)]
+
+        path = triangle_search.find_max_path(nums)
+        actual_max_sum = sum(nums[row][col] for row, col in enumerate(path))
+        expected_max_sum = triangle_search.find_max_sum_rows(nums)
+        self.assertEqual(actual_max_sum,
+                         expected_max_sum,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (expected_max_sum, actual_max_sum))
+
+    def test_find_max_path_rows(self):
+        """Tests that the find_max_path_rows function breaks ties like a
+        BestSumTable.
+        """
+        rand = random.Random(37)
+        nums = [[rand.randint(0, 3) for _ in range(row + 1)]
+                for row in range(60)]
+
+        expected_path = triangle_table.BestSumTable.from_triangle(
+            nums).max_path()
+        actual_path = triangle_search.find_max_path_rows(nums)
+        self.assertEqual(actual_path,
+                         expected_path,
+                         "Expected path (%s) differs from actual (%s)"
+                         % (expected_path, actual_path))
+
+    def test_solve_triangle_file(self):
+        """Tests the solve_triangle_file function with each engine.
+        """
+        temp_dir = tempfile.mkdtemp()
+        try:
+            triangle_path = os.path.join(temp_dir, "triangle.txt")
+            with open(triangle_path, 'w') as triangle_fh:
+                triangle_fh.write("5\n9 6\n4 6 8\n0 7 1 5\n")
+
+            for engine in ("auto", "tree", "table", "stream"):
+                result, choice = triangle_search.solve_triangle_file(
+                    triangle_path, True, engine)
+                self.assertEqual(result,
+                                 {"max_sum": 27, "path": [0, 0, 1, 1]},
+                                 "Unexpected result %s for the %s engine"
+                                 % (result, choice.engine))
+
+            result, choice = triangle_search.solve_triangle_file(
+                triangle_path, memory_budget=1)
+            self.assertEqual((result, choice.engine),
+                             ({"max_sum": 27}, "stream"),
+                             "Unexpected result %s for the %s engine"
+                             % (result, choice.engine))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_parse_memory_size(self):
+        """Tests the parse_memory_size function.
+        """
+        for text, expected_bytes in (("100", 100), ("2K", 2048),
+                                     ("1.5m", 1572864), ("1G", 1024 ** 3)):
+            actual_bytes = triangle_search.parse_memory_size(text)
+            self.assertEqual(actual_bytes,
+                             expected_bytes,
+                             "Expected value (%d) differs from actual (%d)"
+                             % (expected_bytes, actual_bytes))
@@ -0,0 +1,77 @@
+'''
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+
+import random
+import unittest
+
+import triangle_segments
+
+
+def _best_from(nums, row, col, last_row):
+    """Finds the best sum from a number to last_row by trying all paths.
+    """
+    if row == last_row:
+        return nums[row][col]
+
+    return nums[row][col] + max(_best_from(nums, row + 1, col, last_row),
+                                _best_from(nums, row + 1, col + 1, last_row))
+
+
+class TestTriangleSegments(unittest.TestCase):
+    def setUp(self):
+        rand = random.Random(30)
+        self.nums = [[rand.randint(-20, 20) for _ in range(row + 1)]
+                     for row in range(11)]
+
+    def test_best_between(self):
+        """Tests the best_between function for every row range.
+        """
+        for block_rows in (1, 3, 4, None):
+            index = triangle_segments.RowRangeIndex(self.nums, block_rows)
+
+            for first_row in range(len(self.nums)):
+                for last_row in range(first_row, len(self.nums)):
+                    expected_sum = max(
+                        _best_from(self.nums, first_row, col, last_row)
+                        for col in range(first_row + 1))
+                    actual_sum = index.best_between(first_row, last_row)
+
+                    self.assertEqual(actual_sum,
+                                     expected_sum,
+                                     "Expected value (%d) differs from "
+                                     "actual (%d) for rows %d to %d with "
+                                     "%s rows per block"
+                                     % (expected_sum, actual_sum, first_row,
+                                        last_row, block_rows))
+
+    def test_best_from(self):
+        """Tests the best_from function for every start number and end row.
+        """
+        index = triangle_segments.RowRangeIndex(self.nums, 3)
+
+        for row in range(len(self.nums)):
+            for col in range(row + 1):
+                for last_row in range(row, len(self.nums)):
+                    expected_sum = _best_from(self.nums, row, col, last_row)
+                    actual_sum = index.best_from(row, col, last_row)
+
+                    self.assertEqual(actual_sum,
+                                     expected_sum,
+                                     "Expected value (%d) differs from "
+                                     "actual (%d) from row %d, column %d to "
+                                     "row %d"
+                                     % (expected_sum, actual_sum, row, col,
+                                        last_row))
+
+    def test_invalid_rows(self):
+        """Tests that queries outside of the triangle are rejected.
+        """
+        index = triangle_segments.RowRangeIndex(self.nums)
+
+        self.assertRaises(IndexError, index.best_between, 3, 2)
+        self.assertRaises(IndexError, index.best_between, 0, 11)
+        self.assertRaises(IndexError, index.best_from, 2, 3, 4)
@@ -0,0 +1,106 @@
+'''
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import triangle_search
+import triangle_stream
+
+
+class TestTriangleStream(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write_triangle(self, nums):
+        """Writes a triangle to a file, with a blank line between the rows
+        to check that blank lines are skipped.
+
+        Args:
+            nums: A list of lists of integers.
+
+        Returns:
+            Path of the file.
+        """
+        triangle_path = os.path.join(self.temp_dir, "triangle.txt")
+        with open(triangle_path, 'w') as triangle_fh:
+            for row in nums:
+                triangle_fh.write(" ".join(str(x) for x in row) + "\n\n")
+
+        return triangle_path
+
+    def _validate_path(self, nums, expected_max_sum, max_sum, path):
+        """Checks that a path is valid and has the maximum sum.
+
+        Args:
+            nums: A list of lists of integers.
+            expected_max_sum: The expected maximum sum.
+            max_sum: The maximum sum returned by find_max_path_streaming.
+            path: The path returned by find_max_path_streaming.
+        """
+        self.assertEqual(max_sum,
+                         expected_max_sum,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (expected_max_sum, max_sum))
+        self.assertEqual(len(path), len(nums),
+                         "Expected path length (%d) differs from actual (%d)"
+                         % (len(nums), len(path)))
+        self.assertEqual(path[0], 0, "Expected path to start at the top")
+
+        for above_col, col in zip(path, path[1:]):
+            self.assertTrue(col - above_col in (0, 1),
+                            "Path %s moves more than one column" % path)
+
+        path_sum = sum(nums[row][col] for row, col in enumerate(path))
+        self.assertEqual(path_sum,
+                         expected_max_sum,
+                         "Expected path sum (%d) differs from actual (%d)"
+                         % (expected_max_sum, path_sum))
+
+    def test_find_max_path_streaming(self):
+        """Tests the find_max_path_streaming function.
+        """
+        nums = [[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]]
+
+        max_sum, path = triangle_stream.find_max_path_streaming(
+            self._write_triangle(nums))
+        self._validate_path(nums, 27, max_sum, path)
+
+    def test_find_max_path_streaming_many_checkpoints(self):
+        """Tests the find_max_path_streaming function with enough rows to
+        thin out the checkpoints several times.
+        """
+        rand = random.Random(31)
+
+        for row_count in (1, 2, 17, 70):
+            nums = [[rand.randint(-100, 100) for _ in range(row + 1)]
+                    for row in range(row_count)]
+
+            max_sum, path = triangle_stream.find_max_path_streaming(
+                self._write_triangle(nums))
+            self._validate_path(nums,
+                                triangle_search.find_max_sum_rows(nums),
+                                max_sum,
+                                path)
+
+    def test_find_max_sum_streaming(self):
+        """Tests the find_max_sum_streaming function.
+        """
+        nums = [[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]]
+
+        actual_max_sum = triangle_stream.find_max_sum_streaming(
+            self._write_triangle(nums))
+        self.assertEqual(actual_max_sum,
+                         27,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (27, actual_max_sum))
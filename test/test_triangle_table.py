@@ -0,0 +1,92 @@
+'''
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import triangle_search
+import triangle_table
+
+
+class TestTriangleTable(unittest.TestCase):
+    def test_max_sum_from(self):
+        """Tests that max_sum_from agrees with the sums cached by
+        find_max_sum.
+        """
+        nums = [[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]]
+        table = triangle_table.BestSumTable.from_triangle(nums)
+
+        num_tree = triangle_search.create_num_tree(nums)
+        triangle_search.find_max_sum(num_tree)
+
+        expected_sums = [(0, 0, num_tree.root.cached_sum),
+                         (1, 1, num_tree.root.right.cached_sum),
+                         (2, 1, num_tree.root.left.right.cached_sum),
+                         (3, 3, 5)]
+
+        for row, col, expected_sum in expected_sums:
+            actual_sum = table.max_sum_from(row, col)
+            self.assertEqual(actual_sum,
+                             expected_sum,
+                             "Expected value (%d) differs from actual (%d) "
+                             "at row %d, column %d"
+                             % (expected_sum, actual_sum, row, col))
+
+        self.assertEqual(table.max_sum(), 27,
+                         "Expected value (%d) differs from actual (%d)"
+                         % (27, table.max_sum()))
+        self.assertRaises(IndexError, table.max_sum_from, 2, 3)
+        self.assertRaises(IndexError, table.max_sum_from, 4, 0)
+
+    def test_max_path(self):
+        """Tests that max_path agrees with find_max_path.
+        """
+        nums = [[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]]
+        table = triangle_table.BestSumTable.from_triangle(nums)
+
+        expected_path = triangle_search.find_max_path(
+            triangle_search.create_num_tree(nums))
+        actual_path = table.max_path()
+        self.assertEqual(actual_path,
+                         expected_path,
+                         "Expected path (%s) differs from actual (%s)"
+                         % (expected_path, actual_path))
+
+    def test_save_and_load(self):
+        """Tests that a saved table is loaded unchanged.
+        """
+        nums = [[5], [9, 6], [4, 6, 8], [0, 7, 1, 5]]
+        table = triangle_table.BestSumTable.from_triangle(nums)
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            table_path = os.path.join(temp_dir, "table.bin")
+            table.save(table_path)
+            loaded_table = triangle_table.BestSumTable.load(table_path)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        self.assertEqual(loaded_table.row_count, table.row_count,
+                         "Expected row count (%d) differs from actual (%d)"
+                         % (table.row_count, loaded_table.row_count))
+        self.assertEqual(list(loaded_table.sums), list(table.sums),
+                         "Expected sums (%s) differ from actual (%s)"
+                         % (list(table.sums), list(loaded_table.sums)))
+
+    def test_from_triangle_overflow(self):
+        """Tests that a triangle whose sums may not fit in a C long is
+        rejected up front.
+        """
+        nums = [[10 ** 17] * (row + 1) for row in range(300)]
+
+        with self.assertRaises(Exception) as context:
+            triangle_table.BestSumTable.from_triangle(nums)
+        self.assertFalse(isinstance(context.exception, OverflowError),
+                         "Expected the triangle to be rejected before the "
+                         "sums overflow")
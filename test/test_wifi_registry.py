@@ -0,0 +1,138 @@
+'''
+Verifies the correct behavior of the wifi_registry module
+
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+import unittest
+
+from wifi_registry import BuildingRegistry
+from wifi_search import CityBuilding
+
+
+def _square(name, x, y, size):
+    """Creates a square building.
+
+    Args:
+        name: Name of the building.
+        x: Minimum x of the square.
+        y: Minimum y of the square.
+        size: Width and height of the square.
+    """
+    return CityBuilding(name, [(x, y), (x, y + size), (x + size, y + size),
+                               (x + size, y), (x, y)])
+
+
+class TestWifiRegistry(unittest.TestCase):
+    """Verifies the correct behavior of the wifi_registry module.
+    """
+
+    def _validate_buildings_with_wifi(self, registry, expected_names):
+        """Checks the names of the buildings with confirmed hotspots.
+
+        Args:
+            registry: A BuildingRegistry.
+            expected_names: The expected building names, in order.
+        """
+        actual_names = [cb.name for cb in registry.buildings_with_wifi()]
+        self.assertEqual(actual_names,
+                         expected_names,
+                         "Expected buildings with Wi-Fi %s differ from "
+                         "actual (%s)" % (expected_names, actual_names))
+
+    def test_insert_update_delete(self):
+        """Verifies that the confirmed buildings follow building edits.
+        """
+        for raster_cell_size in (None, 1.0):
+            registry = BuildingRegistry(10.0, raster_cell_size)
+            registry.insert(_square("A", 0.0, 0.0, 10.0))
+            registry.insert(_square("B", 50.0, 50.0, 25.0))
+            registry.add_hotspot("56-4c-18-eb-13-8b", (5.0, 5.0))
+            self._validate_buildings_with_wifi(registry, ["A"])
+
+            # New building around an already located hotspot.
+            registry.add_hotspot("88-fe-14-a4-aa-2a", (130.0, 130.0))
+            registry.insert(_square("C", 120.0, 120.0, 20.0))
+            self._validate_buildings_with_wifi(registry, ["A", "C"])
+
+            # Corrected outline that no longer contains the hotspot.
+            registry.update(_square("A", 20.0, 0.0, 10.0))
+            self._validate_buildings_with_wifi(registry, ["C"])
+
+            # Corrected outline that now contains a hotspot.
+            registry.update(_square("B", 0.0, 0.0, 8.0))
+            self._validate_buildings_with_wifi(registry, ["B", "C"])
+
+            registry.delete("C")
+            self._validate_buildings_with_wifi(registry, ["B"])
+            self.assertFalse("C" in registry,
+                             "Expected deleted building to be removed")
+            self.assertEqual(len(registry), 2,
+                             "Expected value (%d) differs from actual (%d)"
+                             % (2, len(registry)))
+
+            self.assertRaises(KeyError, registry.insert,
+                              _square("A", 0.0, 0.0, 1.0))
+            self.assertRaises(KeyError, registry.update,
+                              _square("C", 0.0, 0.0, 1.0))
+            self.assertRaises(KeyError, registry.delete, "C")
+
+    def test_update_in_place(self):
+        """Verifies that a building edited in place is re-rasterized from its
+        new outline.
+        """
+        registry = BuildingRegistry(10.0, 1.0)
+        registry.insert(_square("A", 0.0, 0.0, 10.0))
+        registry.add_hotspot("56-4c-18-eb-13-8b", (25.0, 5.0))
+        self._validate_buildings_with_wifi(registry, [])
+
+        cb = registry.get("A")
+        cb.pts = _square("A", 20.0, 0.0, 10.0).pts
+        registry.update(cb)
+        self._validate_buildings_with_wifi(registry, ["A"])
+
+    def test_empty_building(self):
+        """Verifies that a building without outline points is kept but never
+        confirmed.
+        """
+        for raster_cell_size in (None, 1.0):
+            registry = BuildingRegistry(10.0, raster_cell_size)
+            registry.insert(CityBuilding("Empty", []))
+            registry.insert(_square("A", 0.0, 0.0, 10.0))
+            registry.add_hotspot("56-4c-18-eb-13-8b", (5.0, 5.0))
+            self._validate_buildings_with_wifi(registry, ["A"])
+            self.assertTrue("Empty" in registry,
+                            "Expected the empty building to be kept")
+
+    def test_move_and_remove_hotspot(self):
+        """Verifies that moved and removed hotspots update the confirmed
+        buildings.
+        """
+        registry = BuildingRegistry(10.0)
+        registry.insert(_square("A", 0.0, 0.0, 10.0))
+        registry.insert(_square("B", 30.0, 0.0, 10.0))
+
+        registry.add_hotspot("56-4c-18-eb-13-8b", (5.0, 5.0))
+        registry.add_hotspot("56-4c-18-eb-13-8b", (35.0, 5.0))
+        self._validate_buildings_with_wifi(registry, ["B"])
+
+        registry.remove_hotspot("56-4c-18-eb-13-8b")
+        self._validate_buildings_with_wifi(registry, [])
+
+    def test_add_radar_data(self):
+        """Verifies that hotspots are located from radar data.
+        """
+        registry = BuildingRegistry(4.0)
+        registry.insert(_square("Square", 0.0, 0.0, 10.0))
+        registry.insert(_square("Far", 100.0, 100.0, 10.0))
+
+        ratio = registry.add_radar_data(
+            [((0.0, 5.0), [("56-4c-18-eb-13-8b", 90.0)]),
+             ((0.0, 5.0), [("56-4c-18-eb-13-8b", 90.0)]),
+             ((5.0, -5.0), [("56-4c-18-eb-13-8b", 0.0)])])
+        self._validate_buildings_with_wifi(registry, ["Square"])
+        self.assertAlmostEqual(ratio, 1.5, 7,
+                               "Expected compression ratio (%.3f) differs "
+                               "from actual (%.3f)" % (1.5, ratio))
@@ -6,11 +6,17 @@ Created on Oct 19, 2015
 @author: Mitchell Lee
 '''
 
+import random
 import unittest
 
 from wifi_search import (CityBuilding, is_hotspot_in_building,
                          is_line_segment_intersected, azimuth_to_vector,
-                         hotspot_location, hotspot_radar_locations)
+                         hotspot_location, hotspot_radar_locations,
+                         parse_building, parse_city_map_and_radar_data,
+                         find_buildings_with_wifi, is_line_segment_in_box,
+                         BuildingRaster, CELL_INSIDE, rasterize_buildings,
+                         compact_radar_locations, radar_compression_ratio,
+                         match_hotspots_to_buildings, z_order_index)
 
 
 class TestWifiSearch(unittest.TestCase):
@@ -451,4 +457,216 @@ class TestWifiSearch(unittest.TestCase):
                                        % (exp_azi_vec[1],
                                           act_azi_vec[1],
                                           exp_mac),
-                                       delta=2e-3)
\ No newline at end of file
+                                       delta=2e-3)
+
+    def test_find_buildings_with_wifi(self):
+        """Verifies that the find_buildings_with_wifi function reports the
+        buildings containing a located hotspot, in city map order.
+        """
+        all_buildings, radar_data = parse_city_map_and_radar_data(
+            ["Square 0;0 0;10 10;10 10;0 0;0\n",
+             "Far 100;100 100;110 110;110 110;100 100;100\n",
+             "\n",
+             "0;5 56-4c-18-eb-13-8b;90 88-fe-14-a4-aa-2a;45\n",
+             "5;-5 56-4c-18-eb-13-8b;0\n"])
+
+        confirmed_names = [cb.name for cb in
+                           find_buildings_with_wifi(all_buildings, radar_data)]
+        self.assertEqual(confirmed_names, ["Square"],
+                         "Expected confirmed buildings %s differ from actual "
+                         "(%s)" % (["Square"], confirmed_names))
+        self.assertFalse(all_buildings[0].has_confirmed_wifi,
+                         "Expected find_buildings_with_wifi to leave the "
+                         "buildings unmodified")
+
+        # A building without outline points contains no hotspots.
+        all_buildings.insert(0, parse_building("Empty\n"))
+        confirmed_names = [cb.name for cb in
+                           find_buildings_with_wifi(all_buildings, radar_data)]
+        self.assertEqual(confirmed_names, ["Square"],
+                         "Expected confirmed buildings %s differ from actual "
+                         "(%s) with an empty building"
+                         % (["Square"], confirmed_names))
+
+    def test_is_line_segment_in_box(self):
+        """Verifies that the is_line_segment_in_box function behaves
+        correctly.
+        """
+        box = (0.0, 0.0, 10.0, 10.0)
+
+        self.assertTrue(is_line_segment_in_box((-5.0, 5.0), (15.0, 5.0), box),
+                        "Expected a segment crossing the box to touch it")
+        self.assertTrue(is_line_segment_in_box((2.0, 2.0), (3.0, 3.0), box),
+                        "Expected a segment inside the box to touch it")
+        self.assertTrue(is_line_segment_in_box((-5.0, 0.0), (0.0, -5.0),
+                                               (-2.5, -2.5, 0.0, 0.0)),
+                        "Expected a segment through the box corner to touch "
+                        "it")
+        self.assertFalse(is_line_segment_in_box((-5.0, 4.0), (4.0, -5.0),
+                                                box),
+                         "Expected a segment passing the box corner not to "
+                         "touch it")
+        self.assertFalse(is_line_segment_in_box((11.0, 0.0), (11.0, 10.0),
+                                                box),
+                         "Expected a vertical segment beside the box not to "
+                         "touch it")
+
+    def test_building_raster(self):
+        """Verifies that a BuildingRaster classifies points the same way as
+        the exact is_hotspot_in_building test, even when the building still
+        holds a raster of an older outline, and that buildings with an open
+        outline are not rasterized.
+        """
+        rand = random.Random(33)
+        buildings = [
+            CityBuilding("SimpleRectangle",
+                         [(0.0, 0.0), (0.0, 12.83), (34.04, 12.83),
+                          (34.04, 0.0), (0.0, 0.0)]),
+            CityBuilding("ArrowHead",
+                         [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0),
+                          (20.0, 10.0), (20.0, 30.0), (0.0, 30.0),
+                          (0.0, 0.0)]),
+            CityBuilding("Triangle",
+                         [(3.0, 1.0), (17.5, 4.25), (8.0, 19.0), (3.0, 1.0)]),
+            CityBuilding("Diamond",
+                         [(10.0, 19.0), (20.0, 10.0), (10.0, 0.0),
+                          (0.0, 10.0), (10.0, 20.0)])]
+
+        # Raster of a building far away from the others.
+        stale_raster = BuildingRaster(
+            CityBuilding("FarAway",
+                         [(100.0, 100.0), (100.0, 110.0), (110.0, 110.0),
+                          (110.0, 100.0), (100.0, 100.0)]), 1.0)
+
+        for cb in buildings:
+            test_pts = ([(rand.uniform(-5.0, 40.0), rand.uniform(-5.0, 35.0))
+                         for _ in range(2000)] +
+                        [(x + dx, y + dy) for x, y in cb.pts
+                         for dx in (-0.01, 0.0, 0.01)
+                         for dy in (-0.01, 0.0, 0.01)])
+            expected = [is_hotspot_in_building(cb, pt) for pt in test_pts]
+
+            for cell_size in (0.5, 3.0, 100.0):
+                cb.raster = stale_raster
+                rasterize_buildings([cb], cell_size)
+
+                if cb.pts[0] != cb.pts[-1]:
+                    self.assertTrue(cb.raster is None,
+                                    "Expected building %s with an open "
+                                    "outline not to be rasterized" % cb.name)
+                    self.assertRaises(Exception, BuildingRaster, cb,
+                                      cell_size)
+                elif cell_size == 0.5:
+                    self.assertTrue(CELL_INSIDE in cb.raster.cells,
+                                    "Expected a fine raster of %s to contain "
+                                    "inside cells" % cb.name)
+
+                for pt, is_inside_building in zip(test_pts, expected):
+                    self.assertEqual(is_hotspot_in_building(cb, pt),
+                                     is_inside_building,
+                                     "Expected is_hotspot_in_building to "
+                                     "return %s for test point %s and "
+                                     "building %s rasterized with cell size "
+                                     "%s" % (is_inside_building, str(pt),
+                                             cb.name, cell_size))
+                cb.raster = None
+
+    def test_compact_radar_locations(self):
+        """Verifies that the compact_radar_locations function collapses
+        duplicate and near-duplicate observations per MAC address.
+        """
+        radar_locations = {
+            "56-4c-18-eb-13-8b": [((5.0, 3.0), (0.0, 1.0)),
+                                  ((5.0, 3.0), (0.0, 1.0)),
+                                  ((2.0, 3.0), (0.7071, 0.7071)),
+                                  ((5.000001, 2.999999), (0.000001, 1.0)),
+                                  ((5.0, 3.0), (0.7071, 0.7071))],
+            "88-fe-14-a4-aa-2a": [((5.0, 3.0), (0.7071, 0.7071))]}
+
+        compacted_locations, compacted_counts = compact_radar_locations(
+            radar_locations)
+
+        expected_locations = {
+            "56-4c-18-eb-13-8b": [((5.0, 3.0), (0.0, 1.0)),
+                                  ((2.0, 3.0), (0.7071, 0.7071)),
+                                  ((5.0, 3.0), (0.7071, 0.7071))],
+            "88-fe-14-a4-aa-2a": [((5.0, 3.0), (0.7071, 0.7071))]}
+        expected_counts = {"56-4c-18-eb-13-8b": [3, 1, 1],
+                           "88-fe-14-a4-aa-2a": [1]}
+
+        self.assertEqual(compacted_locations, expected_locations,
+                         "Expected compacted radar locations %s differ from "
+                         "actual (%s)"
+                         % (expected_locations, compacted_locations))
+        self.assertEqual(compacted_counts, expected_counts,
+                         "Expected observation counts %s differ from actual "
+                         "(%s)" % (expected_counts, compacted_counts))
+
+        ratio = radar_compression_ratio(compacted_counts)
+        self.assertAlmostEqual(ratio, 1.5, 7,
+                               "Expected compression ratio (%.3f) differs "
+                               "from actual (%.3f)" % (1.5, ratio))
+        self.assertAlmostEqual(radar_compression_ratio({}), 1.0, 7,
+                               "Expected a compression ratio of 1.0 without "
+                               "observations")
+
+    def test_z_order_index(self):
+        """Verifies that the z_order_index function interleaves the bits of
+        the column and row.
+        """
+        actual_indices = [z_order_index(col, row)
+                          for row in range(2) for col in range(2)]
+        self.assertEqual(actual_indices, [0, 1, 2, 3],
+                         "Expected Z-order indices %s differ from actual (%s)"
+                         % ([0, 1, 2, 3], actual_indices))
+        self.assertEqual(z_order_index(5, 9), 0b10010011,
+                         "Expected Z-order index (%d) differs from actual "
+                         "(%d)" % (0b10010011, z_order_index(5, 9)))
+
+    def test_match_hotspots_to_buildings(self):
+        """Verifies that the match_hotspots_to_buildings function finds the
+        same buildings as testing every hotspot against every building.
+        """
+        rand = random.Random(36)
+        all_buildings = []
+        for index in range(40):
+            x = rand.uniform(0.0, 200.0)
+            y = rand.uniform(0.0, 200.0)
+            width = rand.uniform(1.0, 15.0)
+            height = rand.uniform(1.0, 15.0)
+            all_buildings.append(CityBuilding(
+                "Building%d" % index,
+                [(x, y), (x, y + height), (x + width, y + height),
+                 (x + width, y), (x, y)]))
+
+        hotspot_pts = [(rand.uniform(-10.0, 220.0), rand.uniform(-10.0, 220.0))
+                       for _ in range(300)]
+
+        expected_names = [cb.name for cb in all_buildings
+                          if any(is_hotspot_in_building(cb, pt)
+                                 for pt in hotspot_pts)]
+
+        for cell_size in (None, 3.0, 50.0, 1000.0):
+            actual_names = [cb.name for cb in match_hotspots_to_buildings(
+                hotspot_pts, all_buildings, cell_size)]
+            self.assertEqual(actual_names, expected_names,
+                             "Expected buildings %s differ from actual (%s) "
+                             "for cell size %s"
+                             % (expected_names, actual_names, cell_size))
+
+        self.assertEqual(match_hotspots_to_buildings([], all_buildings), [],
+                         "Expected no buildings without hotspots")
+
+        # The exact test accepts this point level with a vertex far left of
+        # the building, the search box rejects it.
+        cb = CityBuilding("ArrowHead",
+                          [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0),
+                           (20.0, 10.0), (20.0, 30.0), (0.0, 30.0),
+                           (0.0, 0.0)])
+        self.assertTrue(is_hotspot_in_building(cb, (-17.9, 0.00026)),
+                        "Expected the exact test to accept a point level "
+                        "with a vertex")
+        self.assertEqual(match_hotspots_to_buildings([(-17.9, 0.00026)],
+                                                     [cb]), [],
+                         "Expected a point far from the building not to "
+                         "be matched")
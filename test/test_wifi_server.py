@@ -0,0 +1,148 @@
+'''
+Verifies the correct behavior of the wifi_server module
+
+Created on Oct 18, 2026
+
+@author: Mitchell Lee
+'''
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+from wifi_server import CityIndex, create_server
+
+CITY_MAP = ("Square 0;0 0;10 10;10 10;0 0;0\n"
+            "Far 100;100 100;110 110;110 110;100 100;100\n")
+
+RADAR_BATCH = ("0;5 56-4c-18-eb-13-8b;90\n"
+               "5;-5 56-4c-18-eb-13-8b;0\n"
+               "\n")
+
+
+class TestWifiServer(unittest.TestCase):
+    """Verifies the correct behavior of the wifi_server module.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.city_map_path = os.path.join(self.temp_dir, "city_map.txt")
+
+        with open(self.city_map_path, 'w') as city_map_fh:
+            city_map_fh.write(CITY_MAP)
+
+        self.server = create_server(CityIndex(self.city_map_path),
+                                    ("127.0.0.1", 0))
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+        shutil.rmtree(self.temp_dir)
+
+    def _query(self, request):
+        """Sends a request to the server and reads its response.
+
+        Args:
+            request: The request string sent to the server.
+
+        Returns:
+            A list of response lines, without the terminating empty line.
+        """
+        client = socket.create_connection(self.server.server_address)
+        try:
+            client_fh = client.makefile('rw')
+            client_fh.write(request)
+            client_fh.flush()
+
+            response = []
+            for line in iter(client_fh.readline, ""):
+                if line == "\n":
+                    break
+                response.append(line.rstrip("\n"))
+
+            return response
+        finally:
+            client.close()
+
+    def test_radar_batch(self):
+        """Verifies that a radar batch is answered with the buildings that
+        contain hotspots.
+        """
+        response = self._query(RADAR_BATCH)
+        self.assertEqual(response, ["Square"],
+                         "Expected response %s differs from actual (%s)"
+                         % (["Square"], response))
+
+    def test_concurrent_clients(self):
+        """Verifies that several clients can be answered concurrently.
+        """
+        responses = []
+
+        def query():
+            responses.append(self._query(RADAR_BATCH))
+
+        clients = [threading.Thread(target=query) for _ in range(8)]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+
+        self.assertEqual(responses, [["Square"]] * 8,
+                         "Expected every client to receive %s, actual "
+                         "responses were %s" % (["Square"], responses))
+
+    def test_reload(self):
+        """Verifies that the city map is re-read on request.
+        """
+        with open(self.city_map_path, 'w') as city_map_fh:
+            city_map_fh.write("Renamed 0;0 0;10 10;10 10;0 0;0\n")
+
+        reload_response = self._query("RELOAD\n")
+        self.assertEqual(reload_response, ["RELOADED 1"],
+                         "Expected reload response %s differs from actual "
+                         "(%s)" % (["RELOADED 1"], reload_response))
+
+        response = self._query(RADAR_BATCH)
+        self.assertEqual(response, ["Renamed"],
+                         "Expected response %s differs from actual (%s)"
+                         % (["Renamed"], response))
+
+    def test_malformed_radar_batch(self):
+        """Verifies that malformed radar data is reported as an error.
+        """
+        response = self._query("not-a-point\n\n")
+        self.assertTrue(len(response) == 1 and response[0].startswith("ERROR"),
+                        "Expected an error response, actual response was %s"
+                        % response)
+
+    def test_failed_reload(self):
+        """Verifies that a failed reload is reported and keeps the previous
+        city map.
+        """
+        os.remove(self.city_map_path)
+
+        reload_response = self._query("RELOAD\n")
+        self.assertTrue(len(reload_response) == 1 and
+                        reload_response[0].startswith("ERROR"),
+                        "Expected an error response, actual response was %s"
+                        % reload_response)
+
+        response = self._query(RADAR_BATCH)
+        self.assertEqual(response, ["Square"],
+                         "Expected response %s differs from actual (%s)"
+                         % (["Square"], response))
+
+    def test_socket_path_is_not_a_socket(self):
+        """Verifies that a Unix socket path naming a regular file is not
+        removed.
+        """
+        self.assertRaises(Exception, create_server,
+                          self.server.city_index, self.city_map_path)
+        self.assertTrue(os.path.isfile(self.city_map_path),
+                        "Expected the city map to be left in place")